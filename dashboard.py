@@ -1,6 +1,7 @@
 from typing import Literal
 from playback import Playback
 from playlist import Playlist
+from song import Song
 from structures import BinarySearchTree, SongMap
 
 class Dashboard:
@@ -25,6 +26,9 @@ class Dashboard:
         self.__playback = playback
         self.__rating_tree = rating_tree
         self.__songMap = songMap
+        self.__snapshot_key = None
+        self.__snapshot = None
+        self.__snapshot_format = "Songs by Ratings:\n%s\n\nLongest Songs:\n%s\n\nRecently Played:\n%s\n\nPlaylist:\n%s\n\nPlayback:\n%s"
 
     def get_playlist(self) -> str:
         """
@@ -57,6 +61,9 @@ class Dashboard:
         Args:
             song (int): The ID of the song to add.
         
+        Raises:
+            TypeError: If the provided song is not an integer ID.
+        
         Time Complexity: O(1) amortized, due to list append and stack push.
         Space Complexity: O(1)
         """
@@ -69,7 +76,7 @@ class Dashboard:
         Args:
             index (int): The index of the song to remove.
         
-        Time Complexity: O(n) where n is the number of songs in the playlist, due to finding the node by index.
+        Time Complexity: O(n) where n is the number of songs in the playlist, for shifting the following entries.
         Space Complexity: O(1)
         """
         self.__playlist.remove_song(index)
@@ -82,7 +89,7 @@ class Dashboard:
             from_index (int): The current index of the song.
             to_index (int): The target index for the song.
         
-        Time Complexity: O(n) where n is the number of songs in the playlist, due to finding nodes by index.
+        Time Complexity: O(n) where n is the number of songs in the playlist, for shifting the entries between both indices.
         Space Complexity: O(1)
         """
         self.__playlist.move_song(from_index, to_index)
@@ -115,7 +122,7 @@ class Dashboard:
         """
         Shuffles the playlist.
         
-        Time Complexity: O(n log k) where n is the number of songs and k is the number of unique artists.
+        Time Complexity: O(n + k log k) where n is the number of songs and k is the number of unique artists.
         Space Complexity: O(n) to store nodes and artist groupings.
         """
         self.__playlist.shuffle_playlist()
@@ -165,7 +172,7 @@ class Dashboard:
         """
         Plays the next song in the queue, moving the current song to history.
         
-        Time Complexity: O(q) where q is the number of songs in the queue, due to list-based queue dequeue.
+        Time Complexity: O(1), as the deque-based queue dequeues in constant time.
         Space Complexity: O(1)
         """
         self.__playback.play_next()
@@ -226,8 +233,8 @@ class Dashboard:
         """
         Adds all songs from the current playlist to the playback queue.
         
-        Time Complexity: O(n^2) where n is the number of songs in the playlist, due to repeated O(n) lookups in the linked list.
-        Space Complexity: O(1)
+        Time Complexity: O(n) where n is the number of songs in the playlist.
+        Space Complexity: O(n) for the intermediate list of IDs built by Playback.add_playlist_to_queue.
         """
         self.__playback.add_playlist_to_queue(self.__playlist)
 
@@ -253,10 +260,18 @@ class Dashboard:
         Returns:
             str: A formatted string of the recently played songs.
         
+        A negative `num`, or one larger than the history, returns the whole
+        history from oldest to newest; otherwise the last `num` songs are
+        listed newest first.
+
         Time Complexity: O(num) to retrieve and represent the songs.
-        Space Complexity: O(num) to store and represent the songs.
+        Space Complexity: O(num) to represent the songs.
         """
-        return str(self.__playback.get_history(num))
+        history = self.__playback.get_history()
+        if num < 0 or num > history.get_size():
+            return str(history)
+        recent = "\n".join(str(song) for song in history.tail_iter(num))
+        return recent if recent else "Stack is empty"
     
     def search_song(self, song_id: int) -> str:
         """
@@ -285,8 +300,8 @@ class Dashboard:
             song_id (int): The ID of the song to rate.
             rating (float): The rating to assign (0-5).
         
-        Time Complexity: O(log k) where k is the number of rating buckets (a constant).
-        Space Complexity: O(log k) for the recursion stack.
+        Time Complexity: O(log k + m) where k is the number of rating buckets (a constant) and m is the number of songs in the song's bucket.
+        Space Complexity: O(1)
         """
         if not (0 <= rating <= 5):
             return "Rating must be between 0 and 5"
@@ -304,12 +319,10 @@ class Dashboard:
             str: A newline-separated string of songs in the range, or a "not found" message.
         
         Time Complexity: O(log k + m) where k is the number of buckets and m is the number of songs in the matching range.
-        Space Complexity: O(log k + m) for the recursion stack and result dictionary.
+        Space Complexity: O(m) for the joined string.
         """
-        songs = self.__rating_tree.search(start, end)
-        if not songs:
-            return "No songs found in the specified rating range"
-        return "\n".join(str(song) + " : " + str(songs[song]) for song in songs)
+        songs = "\n".join(f"{song} : {rating}" for rating, song in self.__rating_tree.iter_range(start, end))
+        return songs or "No songs found in the specified rating range"
     
     def get_num_songs_by_rating(self) -> str:
         """
@@ -318,14 +331,12 @@ class Dashboard:
         Returns:
             str: A formatted string showing song counts per rating range.
         
-        Time Complexity: O(log k + m) for each call to get_num_by_rating, where k is the number of buckets and m is the number of songs in the range. Since this is done a constant number of times, it's dominated by the largest range.
-        Space Complexity: O(log k + m) for each call, dominated by the largest range.
-        """
-        return f"Songs with rating 0-1: {self.__rating_tree.get_num_by_rating(0, 1)}\n\
-            Songs with rating 1-2: {self.__rating_tree.get_num_by_rating(1, 2)}\n\
-            Songs with rating 2-3: {self.__rating_tree.get_num_by_rating(2, 3)}\n\
-            Songs with rating 3-4: {self.__rating_tree.get_num_by_rating(3, 4)}\n\
-            Songs with rating 4-5: {self.__rating_tree.get_num_by_rating(4, 6)}"
+        Time Complexity: O(k) where k is the number of buckets, as the rating tree keeps per-rating counts.
+        Space Complexity: O(k) for the counts.
+        """
+        labels = ["0-1", "1-2", "2-3", "3-4", "4-5"]
+        counts = self.__rating_tree.counts_by_bucket((0, 1, 2, 3, 4, 6))
+        return "\n".join(f"Songs with rating {label}: {count}" for label, count in zip(labels, counts))
     
     def get_longest_songs(self, num: int = 5) -> str:
         """
@@ -337,8 +348,8 @@ class Dashboard:
         Returns:
             str: A newline-separated string of the longest songs.
         
-        Time Complexity: O(N log N) where N is the total number of songs in the SongMap.
-        Space Complexity: O(N) to create a list of all songs for sorting.
+        Time Complexity: O(N log num) where N is the total number of songs in the SongMap on the first call after a change, O(num) afterwards.
+        Space Complexity: O(num) for the SongMap's cached songs.
         """
         longest_songs = self.__songMap.get_longest_songs(num)
         if not longest_songs:
@@ -350,10 +361,29 @@ class Dashboard:
         Provides a full snapshot of the current state, including ratings,
         longest songs, recent plays, playlist, and playback queue.
 
+        The rendered snapshot is cached together with the versions of the
+        underlying structures and returned as-is while none of them change.
+
         Returns:
             str: A comprehensive formatted string of the application's state.
         
-        Time Complexity: O(N log k + n + q + h) where N is total songs, n is playlist size, q is queue size, and h is history size. Dominated by O(N log k) from get_longest_songs.
-        Space Complexity: O(k + n + q + h) to build the various string representations. Dominated by O(N) from get_longest_songs.
-        """
-        return f"Songs by Ratings:\n{self.get_num_songs_by_rating()}\n\nLongest Songs:\n{self.get_longest_songs()}\n\nRecently Played:\n{self.get_recently_played_songs()}\n\nPlaylist:\n{self.get_playlist()}\n\nPlayback:\n{self.get_playback()}"
\ No newline at end of file
+        Time Complexity: O(1) if nothing changed since the last call; otherwise O(n + q + h) where n is playlist size, q is queue size, and h is history size, plus O(N log k) for get_longest_songs when the SongMap changed.
+        Space Complexity: O(n + q + h) to build the various string representations.
+        """
+        key = (
+            self.__songMap.version,
+            Song.get_edit_count(),
+            self.__rating_tree.version,
+            self.__playlist.get_version(),
+            self.__playback.get_version(),
+        )
+        if key != self.__snapshot_key:
+            self.__snapshot = self.__snapshot_format % (
+                self.get_num_songs_by_rating(),
+                self.get_longest_songs(),
+                self.get_recently_played_songs(),
+                self.get_playlist(),
+                self.get_playback(),
+            )
+            self.__snapshot_key = key
+        return self.__snapshot
\ No newline at end of file
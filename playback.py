@@ -1,3 +1,4 @@
+import copy
 from structures import Stack, Queue, SongMap
 from playlist import Playlist
 from song import Song
@@ -20,6 +21,24 @@ class Playback:
         self.__history = Stack()
         self.__songMap = song_map
 
+    def __deepcopy__(self, memo: dict) -> "Playback":
+        """
+        Returns an independent copy of the play queue and history. The song
+        library is shared rather than copied.
+
+        Args:
+            memo (dict): The copy.deepcopy memo of already copied objects.
+        
+        Time Complexity: O(q + h) where q is the size of the queue and h is the size of the history.
+        Space Complexity: O(q + h)
+        """
+        clone = Playback.__new__(Playback)
+        memo[id(self)] = clone
+        clone.__play_queue = copy.deepcopy(self.__play_queue, memo)
+        clone.__history = copy.deepcopy(self.__history, memo)
+        clone.__songMap = self.__songMap
+        return clone
+
     def add_song_to_queue(self, song: int) -> None:
         """
         Adds a single song to the end of the play queue.
@@ -40,11 +59,10 @@ class Playback:
             playlist (Playlist): The playlist to add.
         
         Time Complexity: O(n) where n is the number of songs in the playlist,
-                         as we iterate through the playlist once.
-        Space Complexity: O(1)
+                         as the playlist's IDs are copied into the queue in a single extend.
+        Space Complexity: O(n) for the intermediate list of IDs.
         """
-        for song_id in playlist.get_songs_iterable():
-            self.__play_queue.enqueue(song_id)
+        self.__play_queue.extend(playlist.raw_ids())
 
     def play_next(self) -> None:
         """
@@ -53,7 +71,7 @@ class Playback:
         Raises:
             IndexError: If the play queue is empty or has only one song.
         
-        Time Complexity: O(n) where n is the number of songs in the queue, due to Queue.dequeue.
+        Time Complexity: O(1), as Queue.dequeue pops from the front of a deque.
         Space Complexity: O(1)
         """
         if self.__play_queue.is_empty():
@@ -113,7 +131,7 @@ class Playback:
 
         Args:
             num (int, optional): The number of recent history items to return. 
-                                 Defaults to -1, which returns the entire history.
+                                 Defaults to -1; any negative value returns the entire history.
 
         Returns:
             Stack: A stack containing the requested history.
@@ -121,11 +139,23 @@ class Playback:
         Time Complexity: O(k) where k is `num` if specified, otherwise O(1) to return the reference.
         Space Complexity: O(k) where k is `num` if specified, otherwise O(1).
         """
-        if num == -1 or num > self.__history.get_size():
+        if num < 0 or num > self.__history.get_size():
             return self.__history
         else:
             return Stack(self.__history.peek(num))
         
+    def get_version(self) -> tuple[int, int]:
+        """
+        Returns a value that changes whenever the play queue or the history change.
+
+        Returns:
+            tuple[int, int]: The versions of the play queue and the history.
+        
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return (self.__play_queue.version, self.__history.version)
+        
     def __str__(self) -> str:
         """
         Returns a string representation of the current playback state.
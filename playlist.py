@@ -1,9 +1,10 @@
-from typing import Literal
+import copy
+from typing import Iterable, Iterator, Literal
 from structures import DoublyLinkedList, Stack, SongMap
 
 class Change:
     """Represents a single change operation for undo/redo functionality."""
-    def __init__(self, change_type: Literal["add", "remove", "move", "reverse", "sort", "rename", "shuffle"], change: dict | list) -> None:
+    def __init__(self, change_type: Literal["add", "add_bulk", "remove", "move", "reverse", "sort", "rename", "shuffle"], change: dict | list) -> None:
         """
         Initializes a Change object.
 
@@ -19,12 +20,16 @@ class Change:
 
     def __str__(self) -> str:
         """
-        Returns a string representation of the change.
+        Returns a string representation of the change. Sort and shuffle
+        changes hold a snapshot of playlist nodes, which is shown as song IDs.
         
-        Time Complexity: O(1)
-        Space Complexity: O(1)
+        Time Complexity: O(1), or O(n) for sort and shuffle snapshots of n songs.
+        Space Complexity: O(1), or O(n) for sort and shuffle snapshots of n songs.
         """
-        return f"Change Type: {self.change_type}, Change: {self.change}"
+        change = self.change
+        if self.change_type in ("sort", "shuffle"):
+            change = [change[0], [node.song for node in change[1]]]
+        return f"Change Type: {self.change_type}, Change: {change}"
 
 class Playlist:
     """
@@ -46,6 +51,39 @@ class Playlist:
         self.__name = name
         self.__songs = DoublyLinkedList(song_map)
         self.__edits = Stack()
+        self.__undo_steps = 0
+
+    def __push_change(self, change: Change) -> None:
+        """
+        Records a change on the edit stack as one undoable step.
+
+        Args:
+            change (Change): The change to record.
+        
+        Time Complexity: O(1) amortized due to Stack.push.
+        Space Complexity: O(1)
+        """
+        self.__edits.push(change)
+        self.__undo_steps += 1
+
+    def __deepcopy__(self, memo: dict) -> "Playlist":
+        """
+        Returns an independent copy of the playlist and its undo history. The
+        song library is shared rather than copied.
+
+        Args:
+            memo (dict): The copy.deepcopy memo of already copied objects.
+        
+        Time Complexity: O(n + c) where n is the number of songs and c is the size of the recorded changes.
+        Space Complexity: O(n + c)
+        """
+        clone = Playlist.__new__(Playlist)
+        memo[id(self)] = clone
+        clone.__name = self.__name
+        clone.__songs = self.__songs.copy()
+        clone.__edits = copy.deepcopy(self.__edits, memo)
+        clone.__undo_steps = self.__undo_steps
+        return clone
 
     def get_name(self) -> str:
         """
@@ -69,7 +107,7 @@ class Playlist:
         Time Complexity: O(1) amortized due to Stack.push.
         Space Complexity: O(1)
         """
-        self.__edits.push(Change("rename", {"initial_name": self.__name, "new_name": name}))
+        self.__push_change(Change("rename", {"initial_name": self.__name, "new_name": name}))
         self.__name = name
 
     def add_song(self, song: int) -> None:
@@ -87,8 +125,36 @@ class Playlist:
         """
         if not isinstance(song, int):
             raise TypeError("Expected a Song ID")
-        self.__edits.push(Change("add", {"song_added": song}))
         self.__songs.append(song)
+        if not self.__edits.is_empty():
+            last_change = self.__edits.top()
+            if last_change.change_type == "add":
+                # Consecutive adds share one Change; each song is still undone on its own.
+                last_change.change["songs_added"].append(song)
+                self.__undo_steps += 1
+                return
+        self.__push_change(Change("add", {"songs_added": [song]}))
+
+    def extend_songs(self, songs: Iterable[int]) -> None:
+        """
+        Adds several songs to the end of the playlist as a single undoable change.
+
+        Args:
+            songs (Iterable[int]): The IDs of the songs to add, in order.
+
+        Raises:
+            TypeError: If any of the provided songs is not an integer ID. No song is added.
+        
+        Time Complexity: O(k) where k is the number of songs added.
+        Space Complexity: O(k)
+        """
+        songs = list(songs)
+        if not songs:
+            return
+        if not all(isinstance(song, int) for song in songs):
+            raise TypeError("Expected a Song ID")
+        self.__songs.extend(songs)
+        self.__push_change(Change("add_bulk", {"count": len(songs)}))
 
     def remove_song(self, index: int) -> None:
         """
@@ -100,13 +166,13 @@ class Playlist:
         Raises:
             IndexError: If the index is out of bounds.
         
-        Time Complexity: O(n) where n is the number of songs, due to DoublyLinkedList.remove.
+        Time Complexity: O(n) where n is the number of songs, for shifting the following entries in DoublyLinkedList.remove.
         Space Complexity: O(1)
         """
         if index < 0 or index >= self.get_size():
             raise IndexError("Index out of bounds")
         song = self.__songs.remove(index)
-        self.__edits.push(Change("remove", {"song_removed": song, "index": index}))
+        self.__push_change(Change("remove", {"song_removed": song, "index": index}))
 
     def move_song(self, from_index: int, to_index: int) -> None:
         """
@@ -119,13 +185,13 @@ class Playlist:
         Raises:
             IndexError: If either index is out of bounds.
         
-        Time Complexity: O(n) where n is the number of songs, due to DoublyLinkedList.move.
+        Time Complexity: O(n) where n is the number of songs, for shifting the entries between both indices in DoublyLinkedList.move.
         Space Complexity: O(1)
         """
         if from_index < 0 or from_index >= self.get_size() or to_index < 0 or to_index >= self.get_size():
             raise IndexError("Index out of bounds")
         self.__songs.move(from_index, to_index)
-        self.__edits.push(Change("move", {"from_index": from_index, "to_index": to_index}))
+        self.__push_change(Change("move", {"from_index": from_index, "to_index": to_index}))
 
     def reverse_playlist(self) -> None:
         """
@@ -135,7 +201,7 @@ class Playlist:
         Space Complexity: O(1)
         """
         self.__songs.reverse()
-        self.__edits.push(Change("reverse", {"playlist_reversed": True}))
+        self.__push_change(Change("reverse", {"playlist_reversed": True}))
 
     def sort_playlist(self, sort_type: Literal["add_time", "name", "duration"], reverse: bool = False) -> None:
         """
@@ -146,20 +212,21 @@ class Playlist:
             reverse (bool, optional): If True, sorts in descending order. Defaults to False.
         
         Time Complexity: O(n log n) where n is the number of songs, due to DoublyLinkedList.sort_list.
-        Space Complexity: O(n) to store the list state for the undo operation.
+        Space Complexity: O(n) to snapshot the song order for the undo operation.
         """
-        self.__edits.push(Change("sort", [{"sort_type": sort_type, "reverse": reverse}, self.__songs]))
+        self.__push_change(Change("sort", [{"sort_type": sort_type, "reverse": reverse}, self.__songs.get_order()]))
         self.__songs.sort_list(sort_type=sort_type, reverse=reverse)
 
     def shuffle_playlist(self) -> None:
         """
         Shuffles the playlist, ensuring no two songs by the same primary artist play consecutively.
         
-        Time Complexity: O(n log k) where n is the number of songs and k is the number of unique artists, due to DoublyLinkedList.shuffle.
-        Space Complexity: O(n) to store the list state for the undo operation.
+        Time Complexity: O(n + k log k) where n is the number of songs and k is the number of unique artists, due to DoublyLinkedList.shuffle.
+        Space Complexity: O(n) to snapshot the song order for the undo operation.
         """
+        snapshot = self.__songs.get_order()
         self.__songs.shuffle()
-        self.__edits.push(Change("shuffle", [{"playlist_shuffled": True}, self.__songs]))
+        self.__push_change(Change("shuffle", [{"playlist_shuffled": True}, snapshot]))
 
     def undo_changes(self, num: int = 1) -> None:
         """
@@ -176,25 +243,29 @@ class Playlist:
         """
         if num < 1:
             raise ValueError("Number of undos must be at least 1")
-        if num > self.__edits.get_size():
+        if num > self.__undo_steps:
             raise ValueError("Not enough edits to undo")
         for _ in range(num):
             if not self.__edits.is_empty():
                 change = self.__edits.pop()
+                self.__undo_steps -= 1
                 if change.change_type == "rename":
                     self.__name = change.change["initial_name"]
                 elif change.change_type == "add":
+                    change.change["songs_added"].pop()
                     self.__songs.remove(self.__songs.get_size() - 1)
+                    if change.change["songs_added"]:
+                        self.__edits.push(change)
+                elif change.change_type == "add_bulk":
+                    self.__songs.pop_last_n(change.change["count"])
                 elif change.change_type == "remove":
                     self.__songs.insert(change.change["index"], change.change["song_removed"])
                 elif change.change_type == "move":
                     self.__songs.move(change.change["to_index"], change.change["from_index"])
                 elif change.change_type == "reverse":
                     self.__songs.reverse()
-                elif change.change_type == "sort":
-                    self.__songs = change.change[1]
-                elif change.change_type == "shuffle":
-                    self.__songs = change.change[1]
+                elif change.change_type in ("sort", "shuffle"):
+                    self.__songs.set_order(change.change[1])
 
     def get_song(self, index: int) -> int:
         """
@@ -209,7 +280,7 @@ class Playlist:
         Raises:
             IndexError: If the index is out of bounds.
         
-        Time Complexity: O(n) where n is the number of songs, due to DoublyLinkedList.get_node.
+        Time Complexity: O(1), as DoublyLinkedList.get_node indexes directly.
         Space Complexity: O(1)
         """
         if index < 0 or index >= self.get_size():
@@ -232,6 +303,10 @@ class Playlist:
         """
         Returns the stack of changes made to the playlist.
 
+        Consecutive single-song adds are coalesced into one "add" Change whose
+        "songs_added" list grows with each add; undo_changes still reverts them
+        one song at a time.
+
         Returns:
             Stack: The stack containing all edit operations.
         
@@ -240,6 +315,30 @@ class Playlist:
         """
         return self.__edits
     
+    def raw_ids(self) -> list[int]:
+        """
+        Returns the song IDs in the playlist as a list, for bulk consumers.
+
+        Returns:
+            list[int]: The song IDs in playlist order.
+        
+        Time Complexity: O(n) where n is the number of songs.
+        Space Complexity: O(n) for the returned list.
+        """
+        return self.__songs.song_ids()
+
+    def get_version(self) -> tuple[int, int]:
+        """
+        Returns a value that changes whenever the songs or the edit history change.
+
+        Returns:
+            tuple[int, int]: The versions of the song list and the edit stack.
+        
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return (self.__songs.version, self.__edits.version)
+
     def get_songs_iterable(self):
         """
         Returns an iterator for the songs in the playlist.
@@ -252,6 +351,28 @@ class Playlist:
         """
         return iter(self.__songs)
     
+    def __iter__(self) -> Iterator[int]:
+        """
+        Iterates over the song IDs in playlist order.
+
+        Returns:
+            Iterator[int]: An iterator that yields song IDs.
+        
+        Time Complexity: O(1) to create the iterator, O(n) to exhaust it.
+        Space Complexity: O(1)
+        """
+        return iter(self.__songs)
+
+    def __length_hint__(self) -> int:
+        """
+        Returns the number of songs, so tuple(playlist) and list(playlist) can
+        size their result up front.
+        
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return self.__songs.size
+
     def __str__(self) -> str:
         """
         Returns a string representation of the playlist.
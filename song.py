@@ -1,113 +1,444 @@
+import heapq
+import sys
+from array import array
+from itertools import starmap
+from operator import index
+from typing import Iterable
+
+_lineups: dict[tuple[str, ...], tuple[str, ...]] = {}
+
+def _non_negative(value: int, field_name: str) -> int:
+    """
+    Coerces an integer-like value to a plain int and rejects negatives.
+
+    Args:
+        value (int): The value to check.
+        field_name (str): The field name used in the error message.
+
+    Returns:
+        int: The value as a plain int.
+
+    Raises:
+        TypeError: If the value is not integer-like.
+        ValueError: If the value is negative.
+
+    Time Complexity: O(1)
+    Space Complexity: O(1)
+    """
+    value = index(value)
+    if value < 0:
+        raise ValueError(f"{field_name} must be non-negative")
+    return value
+
+def _shared_lineup(artists: Iterable[str]) -> tuple[str, ...]:
+    """
+    Returns the canonical tuple for an artist lineup, so songs credited to the
+    same artists share one tuple of interned strings.
+
+    Args:
+        artists (Iterable[str]): The artists of a song, in credit order.
+
+    Returns:
+        tuple[str, ...]: The shared tuple for this lineup.
+
+    Time Complexity: O(a) where a is the number of artists.
+    Space Complexity: O(a) the first time a lineup is seen, O(1) afterwards.
+    """
+    if isinstance(artists, tuple):
+        # Lineups taken from another song are already canonical; skip the rebuild.
+        shared = _lineups.get(artists)
+        if shared is not None:
+            return shared
+    lineup = tuple(sys.intern(artist) for artist in artists)
+    return _lineups.setdefault(lineup, lineup)
+
 class Song:
-    """Represents a song with its details."""
-    
-    def __init__(self, id: int, name: str, artists: list[str], duration: int):
+    """
+    Represents a song with its details.
+
+    Fields are properties backed by private slots, read and assigned directly
+    (song.duration = 90). Every assignment is validated and clears the cached
+    string representation, so readers can rely on id and duration being
+    non-negative ints and on name and artists being interned strings without
+    re-checking.
+
+    Attributes:
+        id (int): The unique identifier for the song.
+        name (str): The name of the song.
+        artists (tuple[str, ...]): The artists who performed the song. Any
+            iterable of names is accepted and stored as a shared tuple.
+        duration (int): The duration of the song in seconds.
+
+    Time Complexity: O(1) to construct.
+    Space Complexity: O(1)
+    """
+    __slots__ = ("_id", "_name", "_artists", "_duration", "_artists_joined", "_str_cache", "_hash")
+    __match_args__ = ("id", "name", "artists", "duration")
+    _edit_count = 0
+
+    def __init__(self, id: int, name: str, artists: Iterable[str], duration: int) -> None:
         """
-        Initializes a Song object.
+        Initializes a Song object. Validates the ID and duration, interns the
+        name and stores the artists as a shared tuple of interned strings, so
+        songs with the same lineup share one object and comparisons between
+        them short-circuit on identity. Also joins the artists once for the
+        string representation.
 
         Args:
             id (int): The unique identifier for the song.
             name (str): The name of the song.
-            artists (list[str]): A list of artists who performed the song.
+            artists (Iterable[str]): The artists who performed the song.
             duration (int): The duration of the song in seconds.
-        
+
+        Raises:
+            TypeError: If the ID or duration is not an integer.
+            ValueError: If the ID or duration is negative.
+
+        Time Complexity: O(a) where a is the number of artists.
+        Space Complexity: O(a) for a lineup not seen before, O(1) otherwise.
+        """
+        self._id = _non_negative(id, "ID")
+        self._hash = hash(self._id)
+        self._name = sys.intern(name)
+        self._artists = _shared_lineup(artists)
+        self._artists_joined = ", ".join(self._artists)
+        self._duration = _non_negative(duration, "Duration")
+        self._str_cache = None
+
+    @property
+    def id(self) -> int:
+        """
+        The ID of the song.
+
         Time Complexity: O(1)
         Space Complexity: O(1)
         """
-        self.__id = id
-        self.__name = name
-        self.__artists = artists
-        self.__duration = duration
+        return self._id
 
-    def get_id(self) -> int:
+    @id.setter
+    def id(self, id: int) -> None:
         """
-        Returns the ID of the song.
+        Validates and sets the ID of the song, updating its cached hash.
+
+        Raises:
+            TypeError: If the ID is not an integer.
+            ValueError: If the ID is negative.
 
         Time Complexity: O(1)
         Space Complexity: O(1)
         """
-        return self.__id
-    
-    def set_id(self, id: int) -> None:
+        self._id = _non_negative(id, "ID")
+        self._hash = hash(self._id)
+        self._str_cache = None
+        Song._edit_count += 1
+
+    @property
+    def name(self) -> str:
         """
-        Sets the ID of the song.
+        The name of the song.
 
-        Args:
-            id (int): The new ID for the song.
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return self._name
+
+    @name.setter
+    def name(self, name: str) -> None:
+        """
+        Interns and sets the name of the song.
 
         Time Complexity: O(1)
         Space Complexity: O(1)
         """
-        self.__id = id
+        self._name = sys.intern(name)
+        self._str_cache = None
+        Song._edit_count += 1
 
-    def get_name(self) -> str:
+    @property
+    def artists(self) -> tuple[str, ...]:
         """
-        Returns the name of the song.
+        The artists of the song, as a shared tuple.
 
         Time Complexity: O(1)
         Space Complexity: O(1)
         """
-        return self.__name
+        return self._artists
 
-    def get_artists(self) -> list[str]:
+    @artists.setter
+    def artists(self, artists: Iterable[str]) -> None:
         """
-        Returns the list of artists for the song.
+        Sets the artists of the song from any iterable of names.
+
+        Time Complexity: O(a) where a is the number of artists.
+        Space Complexity: O(a) for a lineup not seen before, O(1) otherwise.
+        """
+        self._artists = _shared_lineup(artists)
+        self._artists_joined = ", ".join(self._artists)
+        self._str_cache = None
+        Song._edit_count += 1
+
+    @property
+    def duration(self) -> int:
+        """
+        The duration of the song in seconds.
 
         Time Complexity: O(1)
         Space Complexity: O(1)
         """
-        return self.__artists
+        return self._duration
 
-    def get_duration(self) -> int:
+    @duration.setter
+    def duration(self, duration: int) -> None:
         """
-        Returns the duration of the song in seconds.
+        Validates and sets the duration of the song.
+
+        Raises:
+            TypeError: If the duration is not an integer.
+            ValueError: If the duration is negative.
 
         Time Complexity: O(1)
         Space Complexity: O(1)
         """
-        return self.__duration
-    
-    def set_name(self, name: str) -> None:
+        self._duration = _non_negative(duration, "Duration")
+        self._str_cache = None
+        Song._edit_count += 1
+
+    @classmethod
+    def get_edit_count(cls) -> int:
         """
-        Sets the name of the song.
+        Returns how many times any song has been changed through a setter, so
+        callers caching rendered songs can tell when to refresh.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return cls._edit_count
+
+    @classmethod
+    def bulk(cls, ids: Iterable[int], names: Iterable[str], artists: Iterable[Iterable[str]], durations: Iterable[int]) -> list["Song"]:
+        """
+        Builds many songs from parallel columns in one pass.
 
         Args:
-            name (str): The new name for the song.
+            ids (Iterable[int]): The song IDs.
+            names (Iterable[str]): The song names.
+            artists (Iterable[Iterable[str]]): The artists of each song.
+            durations (Iterable[int]): The song durations in seconds.
+
+        Returns:
+            list[Song]: The songs, one per position in the columns.
+
+        Raises:
+            ValueError: If the columns have different lengths.
+
+        Time Complexity: O(n) where n is the number of songs.
+        Space Complexity: O(n) for the returned list.
+        """
+        return list(starmap(cls, zip(ids, names, artists, durations, strict=True)))
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Two songs are equal when they have the same ID, since the ID is the
+        song's unique key.
 
         Time Complexity: O(1)
         Space Complexity: O(1)
         """
-        self.__name = name
+        if not isinstance(other, Song):
+            return NotImplemented
+        return self._id == other._id
 
-    def set_artists(self, artists: list[str]) -> None:
+    def __hash__(self) -> int:
         """
-        Sets the list of artists for the song.
+        Hashes the song by its ID, consistent with __eq__. The hash is computed
+        whenever the ID is set, so lookups only read it back. A song's ID should
+        not be reassigned while the song is held in a set or used as a key.
 
-        Args:
-            artists (list[str]): The new list of artists.
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return self._hash
+
+    def __repr__(self) -> str:
+        """
+        Returns a developer-facing representation of the Song object.
+
+        Time Complexity: O(a) where a is the number of artists.
+        Space Complexity: O(M) where M is the number of characters in the result.
+        """
+        return f"Song(id={self._id!r}, name={self._name!r}, artists={self._artists!r}, duration={self._duration!r})"
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the Song object. The string is built
+        on the first call and reused until one of the setters changes the song.
+
+        Time Complexity: O(M) on the first call after a change, O(1) afterwards.
+        Space Complexity: O(M) where M is the number of characters in the resulting string.
+        """
+        if self._str_cache is None:
+            self._str_cache = "ID: %d\nName: %s\nArtists: %s\nDuration: %d seconds" % (self._id, self._name, self._artists_joined, self._duration)
+        return self._str_cache
+
+class SongTable:
+    """
+    Column-oriented store for many songs, keeping ids and durations in packed
+    arrays so batch queries run over contiguous machine integers instead of
+    walking individual Song objects. Both columns hold signed 64-bit integers,
+    so only songs whose ID and duration are below 2**63 can be stored.
+
+    Attributes:
+        ids (array): The song IDs as 64-bit integers, one per row.
+        durations (array): The song durations in seconds as 64-bit integers, one per row.
+        names (list[str]): The song names, one per row.
+        artists (list[tuple[str, ...]]): The artists of each song, one lineup per row.
+
+    Time Complexity: O(1) to construct.
+    Space Complexity: O(1)
+    """
+    def __init__(self) -> None:
+        """
+        Initializes an empty SongTable.
 
         Time Complexity: O(1)
         Space Complexity: O(1)
         """
-        self.__artists = artists
-    
-    def set_duration(self, duration: int) -> None:
+        self.ids = array("q")
+        self.durations = array("q")
+        self.names: list[str] = []
+        self.artists: list[tuple[str, ...]] = []
+
+    @classmethod
+    def from_songs(cls, songs: Iterable[Song]) -> "SongTable":
         """
-        Sets the duration of the song.
+        Builds a table holding one row per song, in the given order.
 
         Args:
-            duration (int): The new duration in seconds.
+            songs (Iterable[Song]): The songs to copy into the table.
+
+        Returns:
+            SongTable: The populated table.
+
+        Time Complexity: O(n) where n is the number of songs.
+        Space Complexity: O(n)
+        """
+        table = cls()
+        for song in songs:
+            table.append(song)
+        return table
+
+    def append(self, song: Song) -> None:
+        """
+        Adds a song as the last row of the table.
+
+        Args:
+            song (Song): The song to add.
+
+        Raises:
+            OverflowError: If the song's ID or duration is 2**63 or more. The
+                table is left unchanged.
+
+        Time Complexity: O(1) amortized.
+        Space Complexity: O(1)
+        """
+        self.ids.append(song.id)
+        try:
+            self.durations.append(song.duration)
+        except OverflowError:
+            self.ids.pop()
+            raise
+        self.names.append(song.name)
+        self.artists.append(song.artists)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of rows in the table.
 
         Time Complexity: O(1)
         Space Complexity: O(1)
         """
-        self.__duration = duration
-    
-    def __str__(self) -> str:
+        return len(self.ids)
+
+    def row(self, index: int) -> Song:
         """
-        Returns a string representation of the Song object.
+        Rebuilds the Song stored at a row.
 
-        Time Complexity: O(N) where N is the number of characters in the artists' names.
-        Space Complexity: O(M) where M is the number of characters in the resulting string.
+        Args:
+            index (int): The row to read.
+
+        Returns:
+            Song: A new Song with the row's values.
+
+        Raises:
+            IndexError: If the index is out of bounds.
+
+        Time Complexity: O(a) where a is the number of artists of the song.
+        Space Complexity: O(a)
+        """
+        return Song(self.ids[index], self.names[index], self.artists[index], self.durations[index])
+
+    def to_songs(self) -> list[Song]:
+        """
+        Rebuilds every row as a Song, in table order.
+
+        Returns:
+            list[Song]: One new Song per row.
+
+        Time Complexity: O(n) where n is the number of rows.
+        Space Complexity: O(n) for the returned list.
+        """
+        return Song.bulk(self.ids, self.names, self.artists, self.durations)
+
+    def order_by_duration(self, reverse: bool = False) -> list[int]:
+        """
+        Returns the row indices ordered by duration, without moving any rows.
+
+        Args:
+            reverse (bool, optional): If True, the longest songs come first. Defaults to False.
+
+        Returns:
+            list[int]: The row indices in duration order.
+
+        Time Complexity: O(n log n) where n is the number of rows.
+        Space Complexity: O(n) for the returned indices.
+        """
+        return sorted(range(len(self.durations)), key=self.durations.__getitem__, reverse=reverse)
+
+    def rows_longer_than(self, seconds: int) -> list[int]:
+        """
+        Returns the indices of the rows whose duration exceeds a threshold.
+
+        Args:
+            seconds (int): The exclusive lower bound on the duration.
+
+        Returns:
+            list[int]: The matching row indices in table order.
+
+        Time Complexity: O(n) where n is the number of rows.
+        Space Complexity: O(m) where m is the number of matching rows.
+        """
+        return [index for index, duration in enumerate(self.durations) if duration > seconds]
+
+    def longest_rows(self, num: int) -> list[int]:
+        """
+        Returns the indices of the num longest rows, longest first.
+
+        Args:
+            num (int): The number of rows to return.
+
+        Returns:
+            list[int]: Up to num row indices in descending duration order.
+
+        Time Complexity: O(n log num) where n is the number of rows.
+        Space Complexity: O(num)
+        """
+        return heapq.nlargest(num, range(len(self.durations)), key=self.durations.__getitem__)
+
+    def total_duration(self) -> int:
+        """
+        Returns the combined duration of every row in seconds.
+
+        Time Complexity: O(n) where n is the number of rows.
+        Space Complexity: O(1)
         """
-        return f"ID: {self.__id}\nName: {self.__name}\nArtists: {', '.join(self.__artists)}\nDuration: {self.__duration} seconds"
\ No newline at end of file
+        return sum(self.durations)
\ No newline at end of file
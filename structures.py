@@ -1,8 +1,14 @@
-from typing import Any, Literal, List, Callable, TypeVar
+from typing import Any, Literal, List, Callable, Iterable, Iterator, TypeVar
 from song import Song
 from datetime import datetime
+from collections import deque
+from bisect import bisect_left, bisect_right
+from array import array
+from itertools import islice
+from operator import attrgetter
 import random
 import heapq
+import copy
 
 T = TypeVar('T')
 
@@ -10,54 +16,26 @@ def heap_sort(arr: List[T], key: Callable[[T], any], reverse: bool = False) -> N
     """
     Sorts a list in-place using the heap sort algorithm.
 
+    Each element's key is computed once and paired with the element's index, and
+    the heap is built and drained with the C-implemented heapq primitives, so no
+    comparison or sift step runs as Python bytecode.
+
     Args:
         arr (List[T]): The list to be sorted.
         key (Callable[[T], any]): A function to extract a comparison key from an element.
         reverse (bool, optional): If True, sorts in descending order. Defaults to False.
     
     Time Complexity: O(n log n)
-    Space Complexity: O(log n) for the recursion stack.
+    Space Complexity: O(n) for the keyed heap and the resulting order.
     """
-    n = len(arr)
-
-    def heapify(sub_arr: List[T], size: int, root_idx: int, key_func: Callable[[T], any]):
-        """
-        Helper function to maintain the heap property of a subtree.
-
-        Args:
-            sub_arr (List[T]): The array representing the heap.
-            size (int): The size of the heap.
-            root_idx (int): The root index of the subtree to heapify.
-            key_func (Callable[[T], any]): The key function for comparison.
-        
-        Time Complexity: O(log n)
-        Space Complexity: O(log n) for the recursion stack.
-        """
-        extreme_idx = root_idx
-        left_child_idx = 2 * root_idx + 1
-        right_child_idx = 2 * root_idx + 2
-
-        if not reverse:
-            if left_child_idx < size and key_func(sub_arr[left_child_idx]) > key_func(sub_arr[extreme_idx]):
-                extreme_idx = left_child_idx
-            if right_child_idx < size and key_func(sub_arr[right_child_idx]) > key_func(sub_arr[extreme_idx]):
-                extreme_idx = right_child_idx
-        else:
-            if left_child_idx < size and key_func(sub_arr[left_child_idx]) < key_func(sub_arr[extreme_idx]):
-                extreme_idx = left_child_idx
-            if right_child_idx < size and key_func(sub_arr[right_child_idx]) < key_func(sub_arr[extreme_idx]):
-                extreme_idx = right_child_idx
-
-        if extreme_idx != root_idx:
-            sub_arr[root_idx], sub_arr[extreme_idx] = sub_arr[extreme_idx], sub_arr[root_idx]
-            heapify(sub_arr, size, extreme_idx, key_func)
-
-    for i in range(n // 2 - 1, -1, -1):
-        heapify(arr, n, i, key)
-
-    for i in range(n - 1, 0, -1):
-        arr[i], arr[0] = arr[0], arr[i]
-        heapify(arr, i, 0, key)
+    # The index breaks ties between equal keys, so elements are never compared.
+    heap = list(zip(map(key, arr), range(len(arr))))
+    heapq.heapify(heap)
+    pop = heapq.heappop
+    order = [pop(heap)[1] for _ in range(len(arr))]
+    if reverse:
+        order.reverse()
+    arr[:] = [arr[i] for i in order]
 
 class SongMap:
     """A hash map to store and manage Song objects using their ID as the key."""
@@ -69,6 +47,9 @@ class SongMap:
         Space Complexity: O(1)
         """
         self.song_map = {}
+        self.__longest_cache = None
+        self.__longest_key = None
+        self.version = 0
 
     def add_song(self, song: Song) -> None:
         """
@@ -86,9 +67,36 @@ class SongMap:
         """
         if not isinstance(song, Song):
             raise TypeError("Expected a Song instance")
-        if song.get_id() in self.song_map:
-            raise ValueError(f"Song with ID {song.get_id()} already exists")
-        self.song_map[song.get_id()] = song
+        if song.id in self.song_map:
+            raise ValueError(f"Song with ID {song.id} already exists")
+        self.song_map[song.id] = song
+        self.version += 1
+
+    def add_songs(self, songs: Iterable[Song]) -> None:
+        """
+        Adds several songs to the map in one step. Either every song is added or,
+        if any of them is rejected, none are.
+
+        Args:
+            songs (Iterable[Song]): The song objects to add.
+
+        Raises:
+            TypeError: If any of the provided objects is not a Song instance.
+            ValueError: If a song ID is repeated or already exists in the map.
+        
+        Time Complexity: O(k) on average where k is the number of songs added.
+        Space Complexity: O(k) for the staged entries.
+        """
+        entries = {}
+        for song in songs:
+            if not isinstance(song, Song):
+                raise TypeError("Expected a Song instance")
+            if song.id in self.song_map or song.id in entries:
+                raise ValueError(f"Song with ID {song.id} already exists")
+            entries[song.id] = song
+        if entries:
+            self.song_map.update(entries)
+            self.version += 1
 
     def search_song(self, song_id: str) -> Song | None:
         """
@@ -121,38 +129,37 @@ class SongMap:
         """
         if not isinstance(song, Song):
             raise TypeError("Expected a Song instance")
-        if song.get_id() not in self.song_map:
-            raise ValueError(f"Song with ID {song.get_id()} does not exist")
-        del self.song_map[song.get_id()]
+        if song.id not in self.song_map:
+            raise ValueError(f"Song with ID {song.id} does not exist")
+        del self.song_map[song.id]
+        self.version += 1
 
     def get_longest_songs(self, num: int = 5) -> List[Song]:
         """
         Gets the longest songs from the map.
 
+        The longest songs are selected with a bounded heap and cached; later calls
+        asking for at most as many songs reuse the cache until the map or any song
+        is modified.
+
         Args:
             num (int, optional): The number of longest songs to return. Defaults to 5.
 
         Returns:
             List[Song]: A list of the longest songs, sorted by duration in descending order.
         
-        Time Complexity: O(n log k) where n is the total number of songs and k is num.
-        Space Complexity: O(k) to store the heap.
+        Time Complexity: O(N log k) to refresh the cache where N is the total number of songs and k is num, then O(k) per call.
+        Space Complexity: O(k) for the cached songs.
         """
         if num <= 0:
             raise ValueError("Number of songs must be greater than 0")
-        min_heap = []
-        for song in self.song_map.values():
-            if len(min_heap) < num:
-                heapq.heappush(min_heap, (song.get_duration(), song.get_id(), song))
-            else:
-                # If the current song is longer than the shortest in the heap, replace it.
-                if song.get_duration() > min_heap[0][0]:
-                    heapq.heapreplace(min_heap, (song.get_duration(), song.get_id(), song))
-        
-        # The heap now contains the 'num' longest songs. Sort them by duration descending.
-        longest_songs = [song for _, _, song in min_heap]
-        longest_songs.sort(key=lambda s: s.get_duration(), reverse=True)
-        return longest_songs
+        key = (self.version, Song.get_edit_count())
+        cache = self.__longest_cache
+        if self.__longest_key != key or (num > len(cache) and len(cache) < len(self.song_map)):
+            cache = heapq.nlargest(num, self.song_map.values(), key=attrgetter("duration"))
+            self.__longest_cache = cache
+            self.__longest_key = key
+        return cache[:num]
 
     def __str__(self) -> str:
         """
@@ -161,10 +168,12 @@ class SongMap:
         Time Complexity: O(n) where n is the number of songs.
         Space Complexity: O(n) to build the string.
         """
-        return "\n".join(str(song) for song in self.song_map.values())
+        return "\n\n".join(map(str, self.song_map.values()))
 
 class DoublyLinkedListNode:
     """Node for use in a DoublyLinkedList."""
+    __slots__ = ("song", "add_time")
+
     def __init__(self, song: int):
         """
         Initializes a DoublyLinkedListNode.
@@ -176,12 +185,35 @@ class DoublyLinkedListNode:
         Space Complexity: O(1)
         """
         self.song = song
-        self.prev = None
-        self.next = None
         self.add_time = datetime.now()
 
+    def __deepcopy__(self, memo: dict) -> 'DoublyLinkedListNode':
+        """
+        Returns the node itself. Nodes are never modified after creation, so
+        copies of a playlist and its undo snapshots can share them.
+        
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return self
+
+    def __repr__(self) -> str:
+        """
+        Returns a developer-facing representation of the node.
+        
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return f"DoublyLinkedListNode(song={self.song!r}, add_time={self.add_time!r})"
+
 class DoublyLinkedList:
-    """A doubly linked list implementation for a playlist."""
+    """
+    A playlist sequence of song nodes.
+
+    Nodes are kept in a Python list ordered by position, so looking up a node
+    by index is O(1) and inserting or removing shifts pointers in C instead of
+    walking the list node by node.
+    """
     def __init__(self, songMap: SongMap):
         """
         Initializes an empty DoublyLinkedList.
@@ -192,46 +224,57 @@ class DoublyLinkedList:
         Time Complexity: O(1)
         Space Complexity: O(1)
         """
-        self.head = None
-        self.tail = None
-        self.size = 0
+        self.__nodes = []
         self.__songMap = songMap
+        self.version = 0
+
+    @property
+    def head(self) -> DoublyLinkedListNode | None:
+        """
+        Returns the first node of the list, or None if the list is empty.
+        
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return self.__nodes[0] if self.__nodes else None
+
+    @property
+    def tail(self) -> DoublyLinkedListNode | None:
+        """
+        Returns the last node of the list, or None if the list is empty.
+        
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return self.__nodes[-1] if self.__nodes else None
+
+    @property
+    def size(self) -> int:
+        """
+        Returns the number of songs in the list.
+        
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return len(self.__nodes)
 
-    def __sort(self, key: Callable[['DoublyLinkedListNode'], any], reverse: bool = False) -> None:
+    def __sort(self, keys: List[Any], reverse: bool = False) -> None:
         """
-        Internal helper to sort the linked list.
+        Internal helper to sort the linked list by precomputed keys.
 
         Args:
-            key (Callable[['DoublyLinkedListNode'], any]): The key function for sorting.
+            keys (List[Any]): The sort key of each node, in current list order.
             reverse (bool, optional): Sort in descending order. Defaults to False.
         
         Time Complexity: O(n log n) where n is the size of the list.
-        Space Complexity: O(n) to store nodes in a list for sorting.
+        Space Complexity: O(n) for the ordering and merge buffer of sorted.
         """
         if self.size <= 1:
             return
-        
-        nodes = []
-        current = self.head
-        while current:
-            nodes.append(current)
-            current = current.next
-        
-        heap_sort(nodes, key=key, reverse=reverse)
-
-        if not nodes:
-            self.head = None
-            self.tail = None
-            return
-
-        self.head = nodes[0]
-        self.head.prev = None
-        self.tail = nodes[-1]
-        self.tail.next = None
-
-        for i in range(len(nodes) - 1):
-            nodes[i].next = nodes[i + 1]
-            nodes[i + 1].prev = nodes[i]
+        nodes = self.__nodes
+        order = sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse)
+        nodes[:] = [nodes[i] for i in order]
+        self.version += 1
 
     def append(self, song: int) -> None:
         """
@@ -240,18 +283,24 @@ class DoublyLinkedList:
         Args:
             song (int): The ID of the song to append.
         
-        Time Complexity: O(1)
+        Time Complexity: O(1) amortized.
         Space Complexity: O(1)
         """
-        new_node = DoublyLinkedListNode(song)
-        if not self.head:
-            self.head = new_node
-            self.tail = new_node
-        else:
-            new_node.prev = self.tail
-            self.tail.next = new_node
-            self.tail = new_node
-        self.size += 1
+        self.__nodes.append(DoublyLinkedListNode(song))
+        self.version += 1
+
+    def extend(self, songs: Iterable[int]) -> None:
+        """
+        Appends every song from an iterable to the end of the list.
+
+        Args:
+            songs (Iterable[int]): The IDs of the songs to append, in order.
+        
+        Time Complexity: O(k) where k is the number of songs appended.
+        Space Complexity: O(k)
+        """
+        self.__nodes.extend(DoublyLinkedListNode(song) for song in songs)
+        self.version += 1
 
     def insert(self, index: int, song: int) -> None:
         """
@@ -261,33 +310,13 @@ class DoublyLinkedList:
             index (int): The index at which to insert the song.
             song (int): The ID of the song to insert.
         
-        Time Complexity: O(n)
+        Time Complexity: O(n) for shifting the following nodes.
         Space Complexity: O(1)
         """
         if index < 0 or index > self.size:
             raise IndexError("Index out of bounds")
-
-        if index == self.size:
-            self.append(song)
-            return
-
-        new_node = DoublyLinkedListNode(song)
-        if index == 0:
-            new_node.next = self.head
-            if self.head:
-                self.head.prev = new_node
-            self.head = new_node
-            if self.tail is None:
-                self.tail = new_node
-        else:
-            current = self.get_node(index)
-            new_node.prev = current.prev
-            new_node.next = current
-            if current.prev:
-                current.prev.next = new_node
-            current.prev = new_node
-        
-        self.size += 1
+        self.__nodes.insert(index, DoublyLinkedListNode(song))
+        self.version += 1
 
     def remove(self, index: int) -> int:
         """
@@ -297,30 +326,43 @@ class DoublyLinkedList:
             index (int): The index of the song to remove.
 
         Returns:
-            int: The ID of the removed song, or None if index is invalid.
+            int: The ID of the removed song.
+
+        Raises:
+            IndexError: If the index is out of bounds.
         
-        Time Complexity: O(n) in the worst case (removing from the end).
+        Time Complexity: O(n) for shifting the following nodes, O(1) when removing from the end.
         Space Complexity: O(1)
         """
         if not (0 <= index < self.size):
             raise IndexError("Index out of bounds for remove")
-        current = self.head
-        for _ in range(index):
-            if current is None:
-                return
-            current = current.next
-        if current is None:
-            return
-        if current.prev:
-            current.prev.next = current.next
-        if current.next:
-            current.next.prev = current.prev
-        if current == self.head:
-            self.head = current.next
-        if current == self.tail:
-            self.tail = current.prev
-        self.size -= 1
-        return current.song
+        self.version += 1
+        return self.__nodes.pop(index).song
+
+    def pop_last_n(self, count: int) -> List[int]:
+        """
+        Removes the last count songs from the list.
+
+        Args:
+            count (int): The number of songs to remove.
+
+        Returns:
+            List[int]: The IDs of the removed songs, in list order.
+
+        Raises:
+            IndexError: If count is negative or larger than the list.
+        
+        Time Complexity: O(k) where k is count.
+        Space Complexity: O(k) for the returned IDs.
+        """
+        if count < 0 or count > self.size:
+            raise IndexError("Count out of bounds for pop_last_n")
+        if count == 0:
+            return []
+        removed = [node.song for node in self.__nodes[-count:]]
+        del self.__nodes[-count:]
+        self.version += 1
+        return removed
 
     def move(self, old_index: int, new_index: int) -> None:
         """
@@ -330,23 +372,16 @@ class DoublyLinkedList:
             old_index (int): The current index of the song.
             new_index (int): The new index for the song.
         
-        Time Complexity: O(n) due to finding nodes by index.
+        Time Complexity: O(n) for shifting the nodes between both indices.
         Space Complexity: O(1)
         """
         if old_index < 0 or new_index < 0:
             return
         if old_index >= self.size or new_index >= self.size:
             return
-        current = self.head
-        for _ in range(old_index):
-            if current is None:
-                return
-            current = current.next
-        if current is None:
-            return
-        song = current.song
-        song = self.remove(old_index)
-        self.insert(new_index, song)
+        node = self.__nodes.pop(old_index)
+        self.__nodes.insert(new_index, node)
+        self.version += 1
 
     def reverse(self) -> None:
         """
@@ -355,16 +390,8 @@ class DoublyLinkedList:
         Time Complexity: O(n)
         Space Complexity: O(1)
         """
-        current = self.head
-        prev = None
-        self.tail = current
-        while current:
-            next_node = current.next
-            current.next = prev
-            current.prev = next_node
-            prev = current
-            current = next_node
-        self.head = prev
+        self.__nodes.reverse()
+        self.version += 1
 
     def sort_list(self, sort_type: Literal["add_time", "name", "duration"], reverse: bool = False) -> None:
         """
@@ -374,82 +401,116 @@ class DoublyLinkedList:
             sort_type (Literal["add_time", "name", "duration"]): The attribute to sort by.
             reverse (bool, optional): Sort in descending order. Defaults to False.
         
-        Time Complexity: O(n log n) due to using heap sort.
-        Space Complexity: O(n) to store nodes in a list for sorting.
+        Time Complexity: O(n log n), and O(n) on an already ordered list.
+        Space Complexity: O(n) for the sort keys.
         """
+        # Keys are extracted once per node with C-level getters, so no Python
+        # callable runs during the sort itself.
         if sort_type == "add_time":
-            self.__sort(key=lambda node: node.add_time, reverse=reverse)
-        else:
-            if sort_type == "name":
-                self.__sort(key=lambda node: self.__songMap.search_song(node.song).get_name(), reverse=reverse)
-            elif sort_type == "duration":
-                self.__sort(key=lambda node: self.__songMap.search_song(node.song).get_duration(), reverse=reverse)
+            self.__sort(list(map(attrgetter("add_time"), self.__nodes)), reverse=reverse)
+        elif sort_type in ("name", "duration"):
+            songs = map(self.__songMap.song_map.__getitem__, self.song_ids())
+            self.__sort(list(map(attrgetter(sort_type), songs)), reverse=reverse)
 
     def shuffle(self) -> None:
         """
         Shuffles the playlist, ensuring no two songs by the same primary artist play consecutively.
-        Uses a max-heap to distribute songs from the most frequent artists.
+        Songs are grouped by artist, the groups are laid out from most to least frequent artist,
+        and that sequence is dealt into the even positions and then the odd positions.
 
         Raises:
             ValueError: If the playlist cannot be shuffled due to a high concentration of songs by a single artist.
         
-        Time Complexity: O(n log k) where n is the number of songs and k is the number of unique artists.
+        Time Complexity: O(n + k log k) where n is the number of songs and k is the number of unique artists.
         Space Complexity: O(n) to store nodes and artist groupings.
         """
         if self.size <= 1:
             return
 
-        nodes = []
-        current = self.head
-        while current:
-            nodes.append(current)
-            current = current.next
-    
+        nodes = list(self.__nodes)
         random.shuffle(nodes)
 
         songs_by_artist = {}
+        song_map = self.__songMap.song_map
         for node in nodes:
-            primary_artist = self.__songMap.search_song(node.song).get_artists()[0] if self.__songMap.search_song(node.song).get_artists() else "Unknown"
-            if primary_artist not in songs_by_artist:
-                songs_by_artist[primary_artist] = []
-            songs_by_artist[primary_artist].append(node)
+            artists = song_map[node.song].artists
+            primary_artist = artists[0] if artists else "Unknown"
+            group = songs_by_artist.get(primary_artist)
+            if group is None:
+                songs_by_artist[primary_artist] = [node]
+            else:
+                group.append(node)
 
-        max_freq = 0
-        if songs_by_artist:
-            max_freq = max(len(songs) for songs in songs_by_artist.values())
+        groups = sorted(songs_by_artist.values(), key=len, reverse=True)
+        max_freq = len(groups[0])
         
         if max_freq > (self.size - max_freq) + 1:
             raise ValueError("Cannot shuffle playlist: too many songs by a single artist to avoid consecutive playback.")
 
-        max_heap = [(-len(songs), artist) for artist, songs in songs_by_artist.items()]
-        heapq.heapify(max_heap)
+        # Once the largest group fits in the even slots, filling evens then odds in
+        # group order never puts two songs of one artist next to each other.
+        ordered = [node for group in groups for node in group]
+        evens = (self.size + 1) // 2
+        shuffled_nodes = [None] * self.size
+        shuffled_nodes[0::2] = ordered[:evens]
+        shuffled_nodes[1::2] = ordered[evens:]
 
-        shuffled_nodes = []
+        self.__nodes = shuffled_nodes
+        self.version += 1
 
-        prev_artist_group = None
-
-        while max_heap:
-            count, artist = heapq.heappop(max_heap)
+    def copy(self) -> 'DoublyLinkedList':
+        """
+        Returns an independent list with the same song order that refers to the
+        same SongMap. Nodes are shared, as they are never modified in place.
+        
+        Time Complexity: O(n)
+        Space Complexity: O(n) for the copied node order.
+        """
+        clone = DoublyLinkedList(self.__songMap)
+        clone.__nodes = list(self.__nodes)
+        clone.version = self.version
+        return clone
 
-            node = songs_by_artist[artist].pop()
-            shuffled_nodes.append(node)
+    def song_ids(self) -> List[int]:
+        """
+        Returns the song IDs in list order as a new list.
+        
+        Time Complexity: O(n), with the loop running in C.
+        Space Complexity: O(n) for the returned list.
+        """
+        return list(map(attrgetter("song"), self.__nodes))
 
-            if prev_artist_group:
-                heapq.heappush(max_heap, prev_artist_group)
+    def to_array(self) -> array:
+        """
+        Returns the song IDs in list order as a packed array of 64-bit integers.
+        
+        Time Complexity: O(n), with the loop running in C.
+        Space Complexity: O(n) for the returned array, at 8 bytes per song.
+        """
+        return array("q", map(attrgetter("song"), self.__nodes))
 
-            if songs_by_artist[artist]:
-                prev_artist_group = (count + 1, artist)
-            else:
-                prev_artist_group = None
+    def get_order(self) -> List[DoublyLinkedListNode]:
+        """
+        Returns a copy of the current node order, e.g. to restore it on undo.
+        Only node references are copied, so songs keep their add times.
+        
+        Time Complexity: O(n)
+        Space Complexity: O(n) for the copied references.
+        """
+        return list(self.__nodes)
 
-        self.head = shuffled_nodes[0]
-        self.head.prev = None
-        self.tail = shuffled_nodes[-1]
-        self.tail.next = None
+    def set_order(self, nodes: List[DoublyLinkedListNode]) -> None:
+        """
+        Replaces the node order with one previously returned by get_order.
 
-        for i in range(len(shuffled_nodes) - 1):
-            shuffled_nodes[i].next = shuffled_nodes[i+1]
-            shuffled_nodes[i+1].prev = shuffled_nodes[i]
+        Args:
+            nodes (List[DoublyLinkedListNode]): The node order to restore.
+        
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        """
+        self.__nodes = list(nodes)
+        self.version += 1
 
     def get_size(self) -> int:
         """
@@ -473,52 +534,53 @@ class DoublyLinkedList:
         Returns:
             DoublyLinkedListNode: The node at the specified index.
         
-        Time Complexity: O(n) in the worst case.
+        Time Complexity: O(1)
         Space Complexity: O(1)
         """
         if index < 0 or index >= self.size:
             raise IndexError("Index out of bounds")
-        current = self.head
-        for _ in range(index):
-            current = current.next
-        return current
+        return self.__nodes[index]
     
     def __iter__(self):
         """Allows iteration over the linked list's songs."""
-        current = self.head
-        while current:
-            yield current.song
-            current = current.next
+        for node in self.__nodes:
+            yield node.song
 
     def __str__(self) -> str:
         """
         Returns a string representation of the playlist.
         
-        Time Complexity: O(n) where n is the number of songs.
+        Time Complexity: O(n) where n is the number of songs, as the parts are joined once.
         Space Complexity: O(n) to build the string.
         """
-        current = self.head
-        if not current:
+        if not self.__nodes:
             return "No songs in the playlist."
-        songs_str = ""
-        while current:
-            songs_str += str(self.__songMap.search_song(current.song)) + "\nAdded at: " + str(current.add_time) + "\n\n"
-            current = current.next
-        return songs_str
+        search_song = self.__songMap.search_song
+        return "".join(f"{search_song(node.song)}\nAdded at: {node.add_time}\n\n" for node in self.__nodes)
 
 class Stack:
-    """A standard Stack implementation (LIFO)."""
-    def __init__(self, items: List[Any] = None):
+    """
+    A standard Stack implementation (LIFO) backed by a deque, or by a packed
+    array when every item is a number of one fixed C type.
+    """
+    def __init__(self, items: List[Any] = None, typecode: str | None = None):
         """
         Initializes the stack.
 
         Args:
             items (List[Any], optional): An initial list of items. Defaults to None.
+            typecode (str | None, optional): An array module typecode, e.g. "q" for
+                                             64-bit integers, to store the items unboxed
+                                             in an array. Defaults to None, which uses a deque.
         
         Time Complexity: O(1) or O(n) if items are provided.
         Space Complexity: O(1) or O(n) if items are provided.
         """
-        self.items = [] if items is None else items
+        if typecode is None:
+            self.items = deque() if items is None else deque(items)
+        else:
+            self.items = array(typecode) if items is None else array(typecode, items)
+        self.version = 0
 
     def push(self, item: Any) -> None:
         """
@@ -531,6 +593,7 @@ class Stack:
         Space Complexity: O(1)
         """
         self.items.append(item)
+        self.version += 1
 
     def pop(self) -> Any:
         """
@@ -546,6 +609,7 @@ class Stack:
         Space Complexity: O(1)
         """
         if not self.is_empty():
+            self.version += 1
             return self.items.pop()
         raise IndexError("Pop from empty stack")
 
@@ -562,13 +626,46 @@ class Stack:
         Raises:
             IndexError: If the stack is empty.
         
-        Time Complexity: O(n) for slicing.
-        Space Complexity: O(n) for the returned slice.
+        Time Complexity: O(n) where n is the number of items peeked.
+        Space Complexity: O(n) for the returned list.
         """
         if not self.is_empty():
-            return self.items[-1:-n-1:-1]
+            return list(islice(reversed(self.items), n))
         raise IndexError("Peek from empty stack")
 
+    def top(self) -> Any:
+        """
+        Returns the top item of the stack without removing it.
+
+        Returns:
+            Any: The most recently pushed item.
+
+        Raises:
+            IndexError: If the stack is empty.
+        
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        if not self.is_empty():
+            return self.items[-1]
+        raise IndexError("Top of empty stack")
+
+    def tail_iter(self, n: int) -> Iterator[Any]:
+        """
+        Returns an iterator over the top n items of the stack, most recent first,
+        without copying them.
+
+        Args:
+            n (int): The maximum number of items to yield.
+
+        Returns:
+            Iterator[Any]: An iterator over the top n items.
+        
+        Time Complexity: O(1) to create the iterator, O(n) to exhaust it.
+        Space Complexity: O(1)
+        """
+        return islice(reversed(self.items), n)
+
     def is_empty(self) -> bool:
         """
         Checks if the stack is empty.
@@ -597,18 +694,101 @@ class Stack:
         return "\n".join(str(item) for item in self.items) if not self.is_empty() else "Stack is empty"
     
 class Queue:
-    """A standard Queue implementation (FIFO)."""
-    def __init__(self, items: List[Any] = None):
+    """
+    A standard Queue implementation (FIFO) backed by a deque, or by a packed
+    array when every item is a number of one fixed C type. In the array form,
+    dequeued items are skipped with a head index and compacted away in bulk.
+    """
+    def __init__(self, items: List[Any] = None, typecode: str | None = None):
         """
         Initializes the queue.
 
         Args:
             items (List[Any], optional): An initial list of items. Defaults to None.
+            typecode (str | None, optional): An array module typecode, e.g. "q" for
+                                             64-bit integers, to store the items unboxed
+                                             in an array. Defaults to None, which uses a deque.
         
         Time Complexity: O(1) or O(n) if items are provided.
         Space Complexity: O(1) or O(n) if items are provided.
         """
-        self.items = [] if items is None else items
+        if typecode is None:
+            self.__items = deque() if items is None else deque(items)
+        else:
+            self.__items = array(typecode) if items is None else array(typecode, items)
+        self.__head = 0
+        self.version = 0
+        self.__bind_pop()
+
+    def __bind_pop(self) -> None:
+        """
+        Internal helper that picks the dequeue routine for the backing store once,
+        so dequeue does not re-check the store's type on every call.
+        
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        if isinstance(self.__items, deque):
+            self.__pop = self.__items.popleft
+        else:
+            self.__pop = self.__pop_packed
+
+    def __pop_packed(self) -> Any:
+        """
+        Internal helper that removes the front item of the array form by advancing
+        the head index, compacting once the consumed prefix is half the array.
+        
+        Time Complexity: O(1) amortized.
+        Space Complexity: O(1)
+        """
+        item = self.__items[self.__head]
+        self.__head += 1
+        if self.__head * 2 >= len(self.__items):
+            self.__compact()
+        return item
+
+    def __compact(self) -> None:
+        """
+        Internal helper that drops the consumed prefix of the array form.
+        
+        Time Complexity: O(n) where n is the number of items in the array.
+        Space Complexity: O(1)
+        """
+        del self.__items[:self.__head]
+        self.__head = 0
+
+    def __deepcopy__(self, memo: dict) -> "Queue":
+        """
+        Returns an independent copy of the queue, rebinding its dequeue routine
+        to the copied backing store.
+
+        Args:
+            memo (dict): The copy.deepcopy memo of already copied objects.
+        
+        Time Complexity: O(n) where n is the number of items in the queue.
+        Space Complexity: O(n)
+        """
+        clone = Queue.__new__(Queue)
+        memo[id(self)] = clone
+        clone.__items = copy.deepcopy(self.__items, memo)
+        clone.__head = self.__head
+        clone.version = self.version
+        clone.__bind_pop()
+        return clone
+
+    @property
+    def items(self) -> deque | array:
+        """
+        The items in the queue, front first. The deque form returns the backing
+        deque itself; the array form returns a copy without the consumed prefix,
+        so callers never see dequeued items and reading never changes the queue.
+        
+        Time Complexity: O(1) for the deque form, O(n) for the array form.
+        Space Complexity: O(1) for the deque form, O(n) for the array form.
+        """
+        if self.__head:
+            return self.__items[self.__head:]
+        return self.__items
 
     def enqueue(self, item: Any) -> None:
         """
@@ -620,7 +800,21 @@ class Queue:
         Time Complexity: O(1) on average.
         Space Complexity: O(1)
         """
-        self.items.append(item)
+        self.__items.append(item)
+        self.version += 1
+
+    def extend(self, items: Iterable[Any]) -> None:
+        """
+        Adds every item from an iterable to the end of the queue in one call.
+
+        Args:
+            items (Iterable[Any]): The items to add, in order.
+        
+        Time Complexity: O(k) where k is the number of items added.
+        Space Complexity: O(k)
+        """
+        self.__items.extend(items)
+        self.version += 1
 
     def dequeue(self) -> Any:
         """
@@ -632,12 +826,14 @@ class Queue:
         Raises:
             IndexError: If the queue is empty.
         
-        Time Complexity: O(n) because list.pop(0) is O(n).
+        Time Complexity: O(1) amortized, as neither deque.popleft() nor advancing the
+                         array head shifts the remaining items on every call.
         Space Complexity: O(1)
         """
-        if not self.is_empty():
-            return self.items.pop(0)
-        raise IndexError("Dequeue from empty queue")
+        if self.is_empty():
+            raise IndexError("Dequeue from empty queue")
+        self.version += 1
+        return self.__pop()
 
     def peek(self) -> Any:
         """
@@ -653,7 +849,7 @@ class Queue:
         Space Complexity: O(1)
         """
         if not self.is_empty():
-            return self.items[0]
+            return self.__items[self.__head]
         raise IndexError("Peek from empty queue")
 
     def is_empty(self) -> bool:
@@ -663,7 +859,7 @@ class Queue:
         Time Complexity: O(1)
         Space Complexity: O(1)
         """
-        return len(self.items) == 0
+        return len(self.__items) == self.__head
 
     def get_size(self) -> int:
         """
@@ -672,7 +868,7 @@ class Queue:
         Time Complexity: O(1)
         Space Complexity: O(1)
         """
-        return len(self.items)
+        return len(self.__items) - self.__head
     
     def __str__(self) -> str:
         """
@@ -681,130 +877,164 @@ class Queue:
         Time Complexity: O(n)
         Space Complexity: O(n)
         """
-        return "\n".join(str(item) for item in self.items) if self.items else "Queue is empty"
-
-class BinarySearchTreeBucketNode:
-    """An internal node in the BinarySearchTree, representing a range of ratings."""
-    def __init__(self, start: int, end: int):
-        self.start = start
-        self.end = end
-        self.left = None
-        self.right = None
+        if self.is_empty():
+            return "Queue is empty"
+        return "\n".join(str(item) for item in islice(self.__items, self.__head, None))
 
 class BinarySearchTreeLeafNode:
-    """A leaf node in the BinarySearchTree, holding songs within a specific rating range."""
-    def __init__(self, start: int, end: int, songs: dict = {}):
+    """
+    A rating bucket in the BinarySearchTree, holding songs within a specific rating range
+    in two parallel sequences sorted by (rating, song): the ratings in a packed array
+    so ranges can be located with bisect directly on them, and the song IDs in a
+    list so IDs of any size are accepted.
+    """
+    def __init__(self, start: int, end: int):
         self.start = start
         self.end = end
-        self.songs = songs
+        self.ratings = array("d")
+        self.songs = []
 
-class BinarySearchTree:
-    """A custom Binary Search Tree to store songs based on their rating."""
-    def __init__(self) -> None:
+    def position(self, rating: float, song: int) -> int:
         """
-        Initializes the BST with a predefined structure of buckets for ratings 0-5.
+        Returns the index where (rating, song) is or would be stored in the leaf.
         
-        Time Complexity: O(1)
+        Time Complexity: O(log m) where m is the number of songs in the leaf.
         Space Complexity: O(1)
         """
-        self.root = BinarySearchTreeBucketNode(0, 6)
-        self.root.left = BinarySearchTreeBucketNode(0, 3)
-        self.root.right = BinarySearchTreeBucketNode(3, 6)
-        self.root.left.left = BinarySearchTreeBucketNode(0, 2)
-        self.root.left.right = BinarySearchTreeLeafNode(2, 3)
-        self.root.right.left = BinarySearchTreeLeafNode(3, 4)
-        self.root.right.right = BinarySearchTreeLeafNode(4, 6)
-        self.root.left.left.left = BinarySearchTreeLeafNode(0, 1)
-        self.root.left.left.right = BinarySearchTreeLeafNode(1, 2)
+        low = bisect_left(self.ratings, rating)
+        high = bisect_right(self.ratings, rating, lo=low)
+        return bisect_left(self.songs, song, lo=low, hi=high)
 
-    def __insert(self, node: BinarySearchTreeBucketNode | BinarySearchTreeLeafNode, rating: float, song: int) -> None:
+class BinarySearchTree:
+    """
+    Stores songs by rating in fixed rating buckets. The buckets are kept in a flat
+    list ordered by their start, and the bucket for a rating is found by binary
+    search over those starts.
+    """
+    def __init__(self) -> None:
         """
-        Internal helper to recursively insert a song.
+        Initializes the rating buckets [0, 1), [1, 2), [2, 3), [3, 4) and [4, 6).
         
-        Time Complexity: O(log k) where k is the number of buckets (constant in this implementation).
-        Space Complexity: O(log k) for recursion stack.
+        Time Complexity: O(1)
+        Space Complexity: O(1)
         """
-        if isinstance(node, BinarySearchTreeLeafNode):
-            if rating < node.start or rating >= node.end:
-                raise ValueError("Rating out of bounds for leaf node")
-            node.songs[song] = rating
-        else:
-            if rating < node.start or rating >= node.end:
-                raise ValueError("Rating out of bounds for bucket node")
-            if rating < (node.start + node.end) / 2:
-                if not node.left:
-                    node.left = BinarySearchTreeLeafNode(node.start, (node.start + node.end) / 2)
-                self.__insert(node.left, rating, song)
-            else:
-                if not node.right:
-                    node.right = BinarySearchTreeLeafNode((node.start + node.end) / 2, node.end)
-                self.__insert(node.right, rating, song)
+        self.buckets = [
+            BinarySearchTreeLeafNode(0, 1),
+            BinarySearchTreeLeafNode(1, 2),
+            BinarySearchTreeLeafNode(2, 3),
+            BinarySearchTreeLeafNode(3, 4),
+            BinarySearchTreeLeafNode(4, 6),
+        ]
+        self.__starts = [bucket.start for bucket in self.buckets]
+        self.__index = {}
+        self.__counts = [0] * 6
+        self.version = 0
 
     def insert(self, rating: float, song: int) -> None:
         """
-        Inserts a song into the tree based on its rating.
+        Inserts a song into the tree based on its rating. Rating a song again
+        replaces its previous rating.
 
         Args:
             rating (float): The rating of the song (0-5).
             song (int): The ID of the song.
+
+        Raises:
+            TypeError: If the song is not an integer ID.
+            ValueError: If the rating is outside 0-5.
         
-        Time Complexity: O(log k) where k is the number of buckets (constant).
-        Space Complexity: O(log k) for recursion stack.
+        Time Complexity: O(log k + m) where k is the number of buckets (constant) and m is the number of songs in the bucket, for shifting the sorted entries.
+        Space Complexity: O(1)
         """
+        # Both checks run before anything changes, so a rejected insert leaves the tree intact.
+        if not isinstance(song, int):
+            raise TypeError("Expected song to be an integer ID")
         if rating < 0 or rating > 5:
             raise ValueError("Rating must be between 0 and 5")
-        self.__insert(self.root, rating, song)
+        if song in self.__index:
+            self.delete(song)
+        node = self.buckets[bisect_right(self.__starts, rating) - 1]
+        index = node.position(rating, song)
+        node.ratings.insert(index, rating)
+        node.songs.insert(index, song)
+        self.__index[song] = (rating, node)
+        self.__counts[int(rating)] += 1
+        self.version += 1
+
+    def __leaves_in_range(self, start: float, end: float) -> Iterator[BinarySearchTreeLeafNode]:
+        """
+        Internal helper that yields each bucket overlapping [start, end) in order.
+        
+        Time Complexity: O(log k) to find the first bucket plus O(1) per bucket yielded, where k is the number of buckets.
+        Space Complexity: O(1)
+        """
+        first = max(bisect_right(self.__starts, start) - 1, 0)
+        for leaf in islice(self.buckets, first, None):
+            if leaf.start >= end:
+                return
+            yield leaf
 
-    def __search(self, node: BinarySearchTreeBucketNode | BinarySearchTreeLeafNode, start: int, end: int) -> dict:
+    @staticmethod
+    def __bounds(leaf: BinarySearchTreeLeafNode, start: float, end: float) -> tuple[int, int]:
         """
-        Internal helper to recursively search for songs in a rating range.
+        Internal helper returning the slice of a leaf's entries with start <= rating < end.
         
-        Time Complexity: O(log k + m) where k is the number of buckets and m is the number of songs in the matching range.
-        Space Complexity: O(log k + m) for recursion stack and result dictionary.
+        Time Complexity: O(log m) where m is the number of songs in the leaf.
+        Space Complexity: O(1)
         """
-        if not node:
-            return {}
-        if isinstance(node, BinarySearchTreeLeafNode):
-            if node.start >= end or node.end <= start:
-                return {}
-            return {k: v for k, v in node.songs.items() if v >= start and v < end}
-        # If it's a bucket node, search both sides
-        return {**self.__search(node.left, start, end), **self.__search(node.right, start, end)}
+        low = bisect_left(leaf.ratings, start)
+        high = bisect_left(leaf.ratings, end, lo=low)
+        return low, high
     
-    def search(self, start: int, end: int) -> dict:
+    def iter_range(self, start: int, end: int) -> Iterator[tuple[float, int]]:
         """
-        Searches for songs within a given rating range.
+        Returns an iterator over the songs within a given rating range, without
+        building an intermediate collection.
 
         Args:
             start (int): The start of the rating range (inclusive).
             end (int): The end of the rating range (exclusive).
 
         Returns:
-            dict: A dictionary of songs matching the rating range.
+            Iterator[tuple[float, int]]: (rating, song) pairs in ascending rating order.
         
-        Time Complexity: O(log k + m) where k is the number of buckets and m is the number of songs in the matching range.
-        Space Complexity: O(log k + m) for recursion stack and result dictionary.
+        Time Complexity: O(1) to create the iterator, O(log k + log m + r) to exhaust it where k is the number of buckets, m is the number of songs in a leaf and r is the number of songs in the matching range.
+        Space Complexity: O(1)
         """
         if start < 0 or end > 6 or start >= end:
             raise ValueError("Invalid range for search")
-        return self.__search(self.root, start, end)
+        return self.__iter_range(start, end)
+
+    def __iter_range(self, start: float, end: float):
+        """
+        Internal generator behind iter_range, yielding each leaf's matching slice.
+        Ratings are read back from the index rather than the leaf's float column,
+        so each song is reported with the rating object it was inserted with.
+        
+        Time Complexity: O(log k + log m + r) as in iter_range.
+        Space Complexity: O(1)
+        """
+        index = self.__index
+        for leaf in self.__leaves_in_range(start, end):
+            low, high = self.__bounds(leaf, start, end)
+            for song in leaf.songs[low:high]:
+                yield index[song][0], song
     
-    def __delete(self, node: BinarySearchTreeBucketNode | BinarySearchTreeLeafNode, song: int) -> bool:
+    def search(self, start: int, end: int) -> dict:
         """
-        Internal helper to recursively delete a song.
+        Searches for songs within a given rating range.
+
+        Args:
+            start (int): The start of the rating range (inclusive).
+            end (int): The end of the rating range (exclusive).
+
+        Returns:
+            dict: A dictionary of songs matching the rating range.
         
-        Time Complexity: O(k + n) in the worst case, where k is number of buckets and n is number of songs in a leaf, as it may traverse the whole tree.
-        Space Complexity: O(log k) for recursion stack.
+        Time Complexity: O(log k + log m + r) where k is the number of buckets, m is the number of songs in a leaf and r is the number of songs in the matching range.
+        Space Complexity: O(r) for the result dictionary.
         """
-        if not node:
-            return False
-        if isinstance(node, BinarySearchTreeLeafNode):
-            if song in node.songs.values():
-                del node.songs[song]
-                return True
-            return False
-        # If it's a bucket node, try to delete from both sides
-        return self.__delete(node.left, song) or self.__delete(node.right, song)
+        return {song: rating for rating, song in self.iter_range(start, end)}
 
     def delete(self, song: int) -> bool:
         """
@@ -816,13 +1046,54 @@ class BinarySearchTree:
         Returns:
             bool: True if the song was found and deleted, False otherwise.
         
-        Time Complexity: O(k + n) in the worst case, where k is number of buckets and n is number of songs in a leaf.
-        Space Complexity: O(log k) for recursion stack.
+        Time Complexity: O(m) where m is the number of songs in the song's leaf, for shifting the sorted entries; the leaf itself is found in O(1).
+        Space Complexity: O(1)
         """
         if not isinstance(song, int):
             raise TypeError("Expected song to be an integer ID")
-        return self.__delete(self.root, song)
+        entry = self.__index.pop(song, None)
+        if entry is None:
+            return False
+        rating, leaf = entry
+        self.__counts[int(rating)] -= 1
+        index = leaf.position(rating, song)
+        del leaf.ratings[index]
+        del leaf.songs[index]
+        self.version += 1
+        return True
     
+    def counts_by_bucket(self, edges: tuple[int, ...] = (0, 1, 2, 3, 4, 6)) -> List[int]:
+        """
+        Counts the songs in consecutive rating ranges with a single pass over the buckets.
+
+        Args:
+            edges (tuple[int, ...], optional): Sorted range boundaries; bucket i covers
+                                               [edges[i], edges[i + 1]). Defaults to (0, 1, 2, 3, 4, 6).
+
+        Returns:
+            List[int]: The number of songs in each bucket.
+
+        Raises:
+            ValueError: If there are fewer than two edges, the edges are not strictly
+                        increasing, or they fall outside the rating range 0-6.
+        
+        Time Complexity: O(b) when every edge is a whole rating, as counts per whole rating are kept up to date; otherwise O(k * b * log m) where k is the number of leaves, b is the number of buckets and m is the number of songs in a leaf.
+        Space Complexity: O(b) for the counts.
+        """
+        if len(edges) < 2 or edges[0] < 0 or edges[-1] > 6:
+            raise ValueError("Invalid edges for counts_by_bucket")
+        if any(low >= high for low, high in zip(edges, edges[1:])):
+            raise ValueError("Invalid edges for counts_by_bucket")
+        if all(edge == int(edge) for edge in edges):
+            return [sum(self.__counts[int(low):int(high)]) for low, high in zip(edges, edges[1:])]
+        counts = [0] * (len(edges) - 1)
+        for leaf in self.__leaves_in_range(edges[0], edges[-1]):
+            for i in range(len(counts)):
+                if edges[i] < leaf.end and edges[i + 1] > leaf.start:
+                    low, high = self.__bounds(leaf, edges[i], edges[i + 1])
+                    counts[i] += high - low
+        return counts
+
     def get_num_by_rating(self, start: int, end: int) -> int:
         """
         Gets the number of songs within a given rating range.
@@ -834,9 +1105,15 @@ class BinarySearchTree:
         Returns:
             int: The number of songs in the range.
         
-        Time Complexity: O(log k + m) where k is the number of buckets and m is the number of songs in the matching range.
-        Space Complexity: O(log k + m) for the search result.
+        Time Complexity: O(1) for whole-number bounds, read from the per-rating counts; otherwise O(log k + log m) where k is the number of buckets and m is the number of songs in a leaf, as matches are counted with bisect.
+        Space Complexity: O(1)
         """
         if start < 0 or end > 6 or start >= end:
             raise ValueError("Invalid range for get_num_by_rating")
-        return len(self.search(start, end))
\ No newline at end of file
+        if start == int(start) and end == int(end):
+            return sum(self.__counts[int(start):int(end)])
+        count = 0
+        for leaf in self.__leaves_in_range(start, end):
+            low, high = self.__bounds(leaf, start, end)
+            count += high - low
+        return count
\ No newline at end of file
@@ -1,5 +1,7 @@
+import copy
 import unittest
-from song import Song
+from array import array
+from song import Song, SongTable
 from structures import (
     SongMap,
     DoublyLinkedList,
@@ -15,25 +17,60 @@ from dashboard import Dashboard
 class TestSong(unittest.TestCase):
     """Tests for the Song class."""
 
-    def test_creation_and_getters(self):
-        """Test song creation and that all getters work correctly."""
+    def test_creation_and_fields(self):
+        """Test song creation and that all fields are set correctly."""
         song = Song(1, "Test Song", ["Artist 1", "Artist 2"], 200)
-        self.assertEqual(song.get_id(), 1)
-        self.assertEqual(song.get_name(), "Test Song")
-        self.assertEqual(song.get_artists(), ["Artist 1", "Artist 2"])
-        self.assertEqual(song.get_duration(), 200)
-
-    def test_setters(self):
-        """Test that all setters correctly update the song's attributes."""
+        self.assertEqual(song.id, 1)
+        self.assertEqual(song.name, "Test Song")
+        self.assertEqual(song.artists, ("Artist 1", "Artist 2"))
+        self.assertEqual(song.duration, 200)
+
+    def test_pattern_matching(self):
+        """Test that songs support positional pattern matching on their fields."""
+        match Song(7, "A", ["X"], 90):
+            case Song(song_id, _, (artist,), duration):
+                self.assertEqual((song_id, artist, duration), (7, "X", 90))
+            case _:
+                self.fail("Song did not match its positional pattern")
+
+    def test_validation(self):
+        """Test that IDs and durations are checked when set."""
+        with self.assertRaises(ValueError):
+            Song(1, "A", [], -5)
+        with self.assertRaises(ValueError):
+            Song(-1, "A", [], 5)
+        with self.assertRaises(TypeError):
+            Song(1, "A", [], 5.5)
+        song = Song(1, "A", [], 5)
+        with self.assertRaises(ValueError):
+            song.duration = -5
+        with self.assertRaises(TypeError):
+            song.id = "7"
+        self.assertEqual(song.duration, 5)
+
+    def test_equality_and_hash_by_id(self):
+        """Test that songs compare and hash by their ID."""
+        song = Song(1, "A", ["X"], 100)
+        same_id = Song(1, "B", ["Y"], 200)
+        self.assertEqual(song, same_id)
+        self.assertNotEqual(song, Song(2, "A", ["X"], 100))
+        self.assertEqual(len({song, same_id}), 1)
+        self.assertNotEqual(song, 1)
+        song.id = 3
+        self.assertEqual(hash(song), hash(Song(3, "C", [], 1)))
+
+    def test_field_assignment(self):
+        """Test that assigning each field correctly updates the song's attributes."""
         song = Song(1, "Old Name", [], 100)
-        song.set_id(99)
-        song.set_name("New Name")
-        song.set_artists(["New Artist"])
-        song.set_duration(300)
-        self.assertEqual(song.get_id(), 99)
-        self.assertEqual(song.get_name(), "New Name")
-        self.assertEqual(song.get_artists(), ["New Artist"])
-        self.assertEqual(song.get_duration(), 300)
+        song.id = 99
+        song.name = "New Name"
+        song.artists = ["New Artist"]
+        song.duration = 300
+        self.assertEqual(song.id, 99)
+        self.assertEqual(song.name, "New Name")
+        self.assertEqual(song.artists, ("New Artist",))
+        self.assertIs(song.artists, Song(2, "Other", ["New Artist"], 100).artists)
+        self.assertEqual(song.duration, 300)
 
     def test_str_representation(self):
         """Test the string representation of a Song."""
@@ -43,6 +80,47 @@ class TestSong(unittest.TestCase):
         song_no_artists = Song(2, "No Artist Song", [], 150)
         expected_str_no_artists = "ID: 2\nName: No Artist Song\nArtists: \nDuration: 150 seconds"
         self.assertEqual(str(song_no_artists), expected_str_no_artists)
+        song.name = "Renamed Song"
+        self.assertEqual(str(song), "ID: 1\nName: Renamed Song\nArtists: Artist 1\nDuration: 200 seconds")
+        song.name = "x"
+        self.assertEqual(str(song), "ID: 1\nName: x\nArtists: Artist 1\nDuration: 200 seconds")
+
+
+class TestSongTable(unittest.TestCase):
+    """Tests for the column-oriented SongTable."""
+
+    def test_batch_queries(self):
+        """Test ordering, filtering and totals over the duration column."""
+        songs = [Song(1, "A", ["X"], 200), Song(2, "B", ["Y"], 100), Song(3, "C", ["Z"], 300)]
+        table = SongTable.from_songs(songs)
+        self.assertEqual(len(table), 3)
+        self.assertEqual(table.order_by_duration(), [1, 0, 2])
+        self.assertEqual(table.order_by_duration(reverse=True), [2, 0, 1])
+        self.assertEqual(table.rows_longer_than(150), [0, 2])
+        self.assertEqual(table.total_duration(), 600)
+        self.assertEqual(table.longest_rows(2), [2, 0])
+        self.assertEqual(table.longest_rows(10), [2, 0, 1])
+        self.assertEqual(str(table.row(2)), str(songs[2]))
+        self.assertEqual([str(song) for song in table.to_songs()], [str(song) for song in songs])
+
+    def test_oversized_song_leaves_table_unchanged(self):
+        """Test that a song too large for the 64-bit columns is rejected without a partial row."""
+        table = SongTable()
+        table.append(Song(1, "A", [], 2**31))
+        self.assertEqual(table.total_duration(), 2**31)
+        for song in (Song(2, "B", [], 2**63), Song(2**63, "C", [], 1)):
+            with self.assertRaises(OverflowError):
+                table.append(song)
+        self.assertEqual((len(table), len(table.durations), len(table.names)), (1, 1, 1))
+
+    def test_bulk_construction(self):
+        """Test building songs from parallel columns."""
+        songs = Song.bulk([1, 2], ["A", "B"], [["X"], ["X", "Y"]], [120, 240])
+        self.assertEqual([song.id for song in songs], [1, 2])
+        self.assertEqual(songs[1].artists, ("X", "Y"))
+        self.assertEqual(songs[1].duration, 240)
+        with self.assertRaises(ValueError):
+            Song.bulk([1, 2], ["A"], [["X"]], [120])
 
 
 class TestHeapSort(unittest.TestCase):
@@ -96,6 +174,18 @@ class TestSongMap(unittest.TestCase):
         with self.assertRaises(TypeError):
             self.song_map.add_song("not a song")
 
+    def test_add_songs(self):
+        """Test adding several songs at once."""
+        self.song_map.add_songs([Song(4, "Song D", [], 100), Song(5, "Song E", [], 120)])
+        self.assertEqual(self.song_map.search_song(5).name, "Song E")
+        with self.assertRaises(ValueError):
+            self.song_map.add_songs([Song(6, "Song F", [], 100), Song(1, "Duplicate", [], 100)])
+        self.assertIsNone(self.song_map.search_song(6))
+        with self.assertRaises(ValueError):
+            self.song_map.add_songs([Song(7, "Song G", [], 100), Song(7, "Song G", [], 100)])
+        with self.assertRaises(TypeError):
+            self.song_map.add_songs(["not a song"])
+
     def test_remove_song(self):
         """Test removing songs."""
         self.song_map.remove_song(self.song1)
@@ -109,13 +199,25 @@ class TestSongMap(unittest.TestCase):
         """Test retrieving the longest songs."""
         longest = self.song_map.get_longest_songs(2)
         self.assertEqual(len(longest), 2)
-        self.assertEqual(longest[0].get_id(), 2) # Song B, 300s
-        self.assertEqual(longest[1].get_id(), 3) # Song C, 240s
+        self.assertEqual(longest[0].id, 2) # Song B, 300s
+        self.assertEqual(longest[1].id, 3) # Song C, 240s
 
         # Test getting more songs than exist
         all_songs = self.song_map.get_longest_songs(5)
         self.assertEqual(len(all_songs), 3)
-        self.assertEqual(all_songs[0].get_id(), 2)
+        self.assertEqual(all_songs[0].id, 2)
+
+        # Test that the cached ordering is refreshed after the map changes
+        self.song_map.add_song(Song(4, "Song D", ["Artist D"], 400))
+        self.assertEqual(self.song_map.get_longest_songs(1)[0].id, 4)
+        self.song_map.remove_song(self.song_map.search_song(4))
+        self.assertEqual(self.song_map.get_longest_songs(1)[0].id, 2)
+        self.song1.duration = 500
+        self.assertEqual(self.song_map.get_longest_songs(1)[0].id, 1)
+
+        # Test durations and IDs beyond the range of fixed-width integers
+        self.song_map.add_song(Song(2**63, "Song E", ["Artist E"], 2**31))
+        self.assertEqual(self.song_map.get_longest_songs(1)[0].id, 2**63)
 
         # Test with an empty map
         empty_map = SongMap()
@@ -131,6 +233,7 @@ class TestSongMap(unittest.TestCase):
         self.assertIn("Song A", map_str)
         self.assertIn("ID: 2", map_str)
         self.assertIn("Song B", map_str)
+        self.assertIn("Duration: 180 seconds\n\nID: 2", map_str)
 
 class TestDataStructures(unittest.TestCase):
     """Tests for Stack, Queue, and BinarySearchTree."""
@@ -145,11 +248,16 @@ class TestDataStructures(unittest.TestCase):
         self.assertIn("1\n2", str(s))
         self.assertEqual(s.get_size(), 2)
         self.assertEqual(s.peek(), [2])
+        self.assertEqual(s.peek(2), [2, 1])
+        self.assertEqual(s.top(), 2)
+        self.assertEqual(list(s.tail_iter(5)), [2, 1])
         self.assertEqual(s.pop(), 2)
         self.assertEqual(s.pop(), 1)
         self.assertTrue(s.is_empty())
         with self.assertRaises(IndexError):
             s.pop()
+        with self.assertRaises(IndexError):
+            s.top()
 
     def test_queue(self):
         """Test the Queue data structure."""
@@ -166,6 +274,37 @@ class TestDataStructures(unittest.TestCase):
         self.assertTrue(q.is_empty())
         with self.assertRaises(IndexError):
             q.dequeue()
+        q.extend([3, 4, 5])
+        self.assertEqual(q.get_size(), 3)
+        self.assertEqual(q.dequeue(), 3)
+
+    def test_packed_stack_and_queue(self):
+        """Test the array-backed Stack and Queue used for song IDs."""
+        s = Stack([1, 2], typecode="q")
+        s.push(3)
+        self.assertEqual(s.peek(2), [3, 2])
+        self.assertEqual(s.pop(), 3)
+        self.assertEqual(str(s), "1\n2")
+        q = Queue(typecode="q")
+        q.extend([1, 2, 3, 4])
+        self.assertEqual(q.dequeue(), 1)
+        self.assertEqual(q.dequeue(), 2)
+        q.enqueue(5)
+        self.assertEqual(q.peek(), 3)
+        self.assertEqual(q.get_size(), 3)
+        self.assertEqual(str(q), "3\n4\n5")
+        self.assertEqual([q.dequeue() for _ in range(3)], [3, 4, 5])
+        self.assertTrue(q.is_empty())
+        self.assertEqual(str(q), "Queue is empty")
+        with self.assertRaises(IndexError):
+            q.peek()
+        q.extend([6, 7, 8])
+        q.dequeue()
+        self.assertEqual(q.items, array("q", [7, 8]))
+        clone = copy.deepcopy(q)
+        self.assertEqual(clone.dequeue(), 7)
+        self.assertEqual(q.peek(), 7)
+        self.assertEqual(q.get_size(), 2)
         
     def test_binary_search_tree(self):
         """Test the BinarySearchTree for song ratings."""
@@ -178,18 +317,49 @@ class TestDataStructures(unittest.TestCase):
         self.assertEqual(bst.get_num_by_rating(4, 6), 2)
         self.assertEqual(bst.get_num_by_rating(0, 1), 1)
         self.assertEqual(len(bst.search(3, 5)), 3)
+        self.assertEqual(bst.counts_by_bucket(), [1, 0, 0, 1, 2])
+        bst.insert(4.2, 6) # Song 6, Rating 4.2
+        bst.insert(1.7, 7) # Song 7, Rating 1.7
+        self.assertEqual(bst.search(4, 4.5), {6: 4.2})
+        self.assertEqual(bst.get_num_by_rating(1, 2), 1)
+        bst.insert(2.5, 1) # Re-rate Song 1
+        self.assertEqual(bst.search(2, 3), {1: 2.5})
+        self.assertEqual(list(bst.iter_range(3, 6)), [(3.2, 2), (4.2, 6), (4.9, 3)])
+        self.assertEqual(bst.get_num_by_rating(4, 6), 2)
+        self.assertTrue(bst.delete(4))
+        self.assertFalse(bst.delete(4))
+        self.assertEqual(bst.get_num_by_rating(0, 1), 0)
+        self.assertEqual(bst.get_num_by_rating(4.5, 6), 1)
+        self.assertEqual(bst.counts_by_bucket((0, 2.5, 6)), [1, 4])
+        bst.insert(4, 8) # Integer rating keeps its type
+        self.assertEqual(repr(bst.search(4, 4.1)[8]), "4")
+        for edges in [(-1, 2), (0, 7), (3, 1), (1, 1), (2,)]:
+            with self.assertRaises(ValueError):
+                bst.counts_by_bucket(edges)
         with self.assertRaises(ValueError):
             bst.insert(6.0, 5) # Invalid rating
         with self.assertRaises(ValueError):
             bst.search(5, 4) # Invalid range
 
+    def test_binary_search_tree_rejected_insert(self):
+        """Test that a rejected insert leaves the tree consistent and large IDs are accepted."""
+        bst = BinarySearchTree()
+        bst.insert(3.5, 1)
+        with self.assertRaises(TypeError):
+            bst.insert(3.2, "2")
+        bst.insert(3.2, 2**63)
+        bst.insert(3.1, 5)
+        self.assertEqual(list(bst.iter_range(3, 4)), [(3.1, 5), (3.2, 2**63), (3.5, 1)])
+        self.assertEqual(bst.get_num_by_rating(3.0, 3.3), 2)
+        self.assertTrue(bst.delete(2**63))
+        self.assertEqual(bst.search(3, 3.3), {5: 3.1})
+
 class TestDoublyLinkedList(unittest.TestCase):
     """Tests for the DoublyLinkedList class."""
 
     def setUp(self):
         self.song_map = SongMap()
-        for i in range(1, 6):
-            self.song_map.add_song(Song(i, chr(64+i), [f"Artist {i}"], 180 + i*10))
+        self.song_map.add_songs(Song(i, chr(64+i), [f"Artist {i}"], 180 + i*10) for i in range(1, 6))
         self.dll = DoublyLinkedList(self.song_map)
         self.dll.append(1)
         self.dll.append(2)
@@ -208,9 +378,10 @@ class TestDoublyLinkedList(unittest.TestCase):
         """Test inserting elements at various positions."""
         self.dll.insert(0, 4)
         self.assertEqual(self.dll.head.song, 4)
-        self.assertEqual([s for s in self.dll], [4, 1, 2, 3])
+        self.assertEqual(self.dll.song_ids(), [4, 1, 2, 3])
         self.dll.insert(2, 5)
-        self.assertEqual([s for s in self.dll], [4, 1, 5, 2, 3])
+        self.assertEqual(self.dll.song_ids(), [4, 1, 5, 2, 3])
+        self.assertEqual(self.dll.to_array(), array("q", [4, 1, 5, 2, 3]))
         self.dll.insert(self.dll.get_size(), 6)
         self.assertEqual(self.dll.tail.song, 6)
         with self.assertRaises(IndexError):
@@ -219,30 +390,30 @@ class TestDoublyLinkedList(unittest.TestCase):
     def test_remove(self):
         """Test removing items from various positions and error handling."""
         self.dll.remove(1) # Remove song '2'
-        self.assertEqual([s for s in self.dll], [1, 3])
+        self.assertEqual(self.dll.song_ids(), [1, 3])
         with self.assertRaises(IndexError):
             self.dll.remove(99) # Index out of bounds
 
     def test_move(self):
         """Test moving an element within the list."""
         self.dll.move(0, 2)
-        self.assertEqual([s for s in self.dll], [2, 3, 1])
+        self.assertEqual(self.dll.song_ids(), [2, 3, 1])
         self.dll.move(2, 0)
-        self.assertEqual([s for s in self.dll], [1, 2, 3])
+        self.assertEqual(self.dll.song_ids(), [1, 2, 3])
 
     def test_reverse(self):
         """Test reversing the list."""
         self.dll.reverse()
-        self.assertEqual([s for s in self.dll], [3, 2, 1])
+        self.assertEqual(self.dll.song_ids(), [3, 2, 1])
         self.assertEqual(self.dll.head.song, 3)
         self.assertEqual(self.dll.tail.song, 1)
 
     def test_sort_list(self):
         """Test sorting the list by various criteria."""
         self.dll.sort_list("duration")
-        self.assertEqual([s for s in self.dll], [1, 2, 3])
+        self.assertEqual(self.dll.song_ids(), [1, 2, 3])
         self.dll.sort_list("name", reverse=True)
-        self.assertEqual([s for s in self.dll], [3, 2, 1])
+        self.assertEqual(self.dll.song_ids(), [3, 2, 1])
 
     def test_sort_with_new_song(self):
         new_song = Song(6, "D", [], 180) # Shortest song
@@ -250,18 +421,11 @@ class TestDoublyLinkedList(unittest.TestCase):
         self.dll.append(6) # List is [1, 2, 3, 6]
 
         self.dll.sort_list("duration")
-        self.assertEqual([s for s in self.dll], [6, 1, 2, 3])
+        self.assertEqual(self.dll.song_ids(), [6, 1, 2, 3])
         
     def test_shuffle(self):
         """Test shuffling the list and artist constraint."""
-        song7 = Song(7, "A", ["Artist A"], 100)
-        song8 = Song(8, "A", ["Artist A"], 100)
-        song9 = Song(9, "A", ["Artist A"], 100)
-        song10 = Song(10, "A", ["Artist A"], 100)
-        self.song_map.add_song(song7)
-        self.song_map.add_song(song8)
-        self.song_map.add_song(song9)
-        self.song_map.add_song(song10)
+        self.song_map.add_songs(Song(i, "A", ["Artist A"], 100) for i in range(7, 11))
 
         dll_shuffle = DoublyLinkedList(self.song_map)
         dll_shuffle.append(2) # Artist 2
@@ -276,14 +440,18 @@ class TestDoublyLinkedList(unittest.TestCase):
 class TestPlaylist(unittest.TestCase):
     """Tests for the Playlist class, including its undo functionality."""
 
+    @classmethod
+    def setUpClass(cls):
+        # The songs and map are only read by these tests, so they are built once.
+        cls.song_map = SongMap()
+        cls.song1 = Song(1, "A", ["Artist A"], 180)
+        cls.song2 = Song(2, "B", ["Artist B"], 240)
+        cls.song3 = Song(3, "C", ["Artist C"], 200)
+        cls.song_map.add_song(cls.song1)
+        cls.song_map.add_song(cls.song2)
+        cls.song_map.add_song(cls.song3)
+
     def setUp(self):
-        self.song_map = SongMap()
-        self.song1 = Song(1, "A", ["Artist A"], 180)
-        self.song2 = Song(2, "B", ["Artist B"], 240)
-        self.song3 = Song(3, "C", ["Artist C"], 200)
-        self.song_map.add_song(self.song1)
-        self.song_map.add_song(self.song2)
-        self.song_map.add_song(self.song3)
         self.playlist = Playlist("My Test Playlist", self.song_map)
 
     def test_operations_and_undo(self):
@@ -297,7 +465,25 @@ class TestPlaylist(unittest.TestCase):
         self.playlist.move_song(0, 1) # State: [2, 1]
         self.playlist.undo_changes() # Undo move -> State: [1, 2]
         
-        self.assertEqual([self.playlist.get_song(i) for i in range(self.playlist.get_size())], [1, 2])
+        self.assertEqual(tuple(self.playlist), (1, 2))
+        self.assertEqual(self.playlist.get_song(0), 1)
+        with self.assertRaises(IndexError):
+            self.playlist.get_song(99)
+
+    def test_undo_sort_and_shuffle(self):
+        """Test that undoing a sort or shuffle restores the previous order."""
+        self.playlist.add_song(1)
+        self.playlist.add_song(2)
+        self.playlist.add_song(3) # State: [1, 2, 3]
+
+        self.playlist.sort_playlist("duration", reverse=True) # State: [2, 3, 1]
+        self.assertEqual(tuple(self.playlist), (2, 3, 1))
+        self.playlist.undo_changes()
+        self.assertEqual(tuple(self.playlist), (1, 2, 3))
+
+        self.playlist.shuffle_playlist()
+        self.playlist.undo_changes()
+        self.assertEqual(tuple(self.playlist), (1, 2, 3))
 
     def test_undo_multiple_changes(self):
         """Test undoing multiple changes at once."""
@@ -307,7 +493,48 @@ class TestPlaylist(unittest.TestCase):
         self.playlist.remove_song(0)
         
         self.playlist.undo_changes(num=2)
-        self.assertEqual([self.playlist.get_song(i) for i in range(self.playlist.get_size())], [1, 2])
+        self.assertEqual(tuple(self.playlist), (1, 2))
+
+    def test_consecutive_adds_share_a_change(self):
+        """Test that consecutive adds are stored together but undone one at a time."""
+        self.playlist.add_song(1)
+        self.playlist.add_song(2)
+        self.playlist.add_song(3)
+        self.assertEqual(self.playlist.get_changes().get_size(), 1)
+        self.playlist.undo_changes()
+        self.assertEqual(tuple(self.playlist), (1, 2))
+        self.playlist.undo_changes(2)
+        self.assertEqual(self.playlist.get_size(), 0)
+        with self.assertRaises(ValueError):
+            self.playlist.undo_changes()
+
+    def test_extend_songs_undo(self):
+        """Test that a bulk add is recorded and undone as a single change."""
+        self.playlist.add_song(1)
+        self.playlist.extend_songs([2, 3])
+        self.assertEqual(self.playlist.get_size(), 3)
+        self.assertEqual(self.playlist.get_changes().get_size(), 2)
+        self.playlist.undo_changes()
+        self.assertEqual(tuple(self.playlist), (1,))
+        with self.assertRaises(TypeError):
+            self.playlist.extend_songs([2, "oops", None, 1.5])
+        self.assertEqual(tuple(self.playlist), (1,))
+        self.assertEqual(self.playlist.get_changes().get_size(), 1)
+
+    def test_deepcopy(self):
+        """Test that a copied playlist and its undo history are independent of the original."""
+        self.playlist.add_song(1)
+        self.playlist.add_song(2)
+        self.playlist.sort_playlist("duration", reverse=True)
+        self.assertTrue(str(self.playlist.get_changes().top()).endswith("[1, 2]]"))
+        clone = copy.deepcopy(self.playlist)
+        clone.add_song(3)
+        clone.undo_changes(2)
+        self.assertEqual(tuple(clone), (1, 2))
+        self.assertEqual(tuple(self.playlist), (2, 1))
+        self.playlist.undo_changes(2)
+        self.assertEqual(tuple(self.playlist), (1,))
+        self.assertEqual(clone.get_size(), 2)
 
     def test_operation_errors(self):
         """Test error handling for playlist operations."""
@@ -320,12 +547,16 @@ class TestPlaylist(unittest.TestCase):
 class TestPlayback(unittest.TestCase):
     """Tests for the Playback class."""
 
+    @classmethod
+    def setUpClass(cls):
+        # The songs and map are only read by these tests, so they are built once.
+        cls.song_map = SongMap()
+        cls.song1 = Song(1, "A", [], 180)
+        cls.song2 = Song(2, "B", [], 240)
+        cls.song_map.add_song(cls.song1)
+        cls.song_map.add_song(cls.song2)
+
     def setUp(self):
-        self.song_map = SongMap()
-        self.song1 = Song(1, "A", [], 180)
-        self.song2 = Song(2, "B", [], 240)
-        self.song_map.add_song(self.song1)
-        self.song_map.add_song(self.song2)
         self.playback = Playback(self.song_map)
 
     def test_queue_and_history(self):
@@ -348,6 +579,16 @@ class TestPlayback(unittest.TestCase):
         self.assertEqual(self.playback.get_play_queue().dequeue(), 1)
         self.assertEqual(self.playback.get_play_queue().dequeue(), 2)
 
+    def test_deepcopy(self):
+        """Test that a copied playback has its own queue and history but shares the songs."""
+        self.playback.add_song_to_queue(1)
+        self.playback.add_song_to_queue(2)
+        clone = copy.deepcopy(self.playback)
+        clone.play_next()
+        self.assertIs(clone.get_current_song(), self.song2)
+        self.assertEqual(self.playback.get_current_song(), self.song1)
+        self.assertTrue(self.playback.get_history().is_empty())
+
     def test_error_cases(self):
         """Test error conditions for playback operations."""
         with self.assertRaises(IndexError):
@@ -398,6 +639,18 @@ class TestDashboard(unittest.TestCase):
         counts = self.dashboard.get_num_songs_by_rating()
         self.assertIn("Songs with rating 4-5: 1", counts)
         
+    def test_recently_played_songs(self):
+        """Test the order and bounds of the recently played listing."""
+        for song_id in (1, 2, 1):
+            self.dashboard.add_song_to_queue(song_id)
+        self.dashboard.play_next_song()
+        self.dashboard.play_next_song()
+        self.assertEqual(self.dashboard.get_recently_played_songs(1), "2")
+        self.assertEqual(self.dashboard.get_recently_played_songs(2), "2\n1")
+        self.assertEqual(self.dashboard.get_recently_played_songs(-1), "1\n2")
+        self.assertEqual(self.dashboard.get_recently_played_songs(-3), "1\n2")
+        self.assertEqual(self.dashboard.get_recently_played_songs(10), "1\n2")
+
     def test_snapshot_and_search(self):
         """Test the get_snapshot method and song searching."""
         self.dashboard.add_song_to_playlist(1)
@@ -409,6 +662,13 @@ class TestDashboard(unittest.TestCase):
         self.assertIn("Longest Songs:", snapshot)
         self.assertIn("Playlist:", snapshot)
         
+        self.assertIs(self.dashboard.get_snapshot(), snapshot)
+        self.dashboard.add_song_to_queue(2)
+        self.assertNotEqual(self.dashboard.get_snapshot(), snapshot)
+        self.song1.name = "Song A Remastered"
+        self.assertIn("Song A Remastered", self.dashboard.get_snapshot())
+        self.song1.name = "Song A"
+
         self.assertIn("Song A", self.dashboard.search_song(1))
         self.assertEqual(self.dashboard.search_song(99), "Song not found")
 